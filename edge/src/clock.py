@@ -0,0 +1,56 @@
+"""
+Cheap UTC ISO-8601 timestamp formatting for hot paths.
+
+Formatting a timezone-aware datetime with ``isoformat()`` is comparatively
+expensive for call sites that run on every log record or health update.
+The date/time prefix only changes once per second, so it is cached keyed on
+the integer epoch second; only the microsecond suffix is formatted per call.
+The output is identical to ``datetime.fromtimestamp(t, tz=UTC).isoformat()``.
+
+CHANGELOG:
+- 2026-10-16: Initial creation
+
+TODO:
+- None
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+_prefix_cache: tuple[int, str] = (-1, "")
+"""Cached ``(epoch_second, "YYYY-MM-DDTHH:MM:SS")`` pair."""
+
+
+def iso_utc(t: float) -> str:
+    """Format an epoch timestamp as an ISO-8601 UTC string.
+
+    Args:
+        t: Seconds since the epoch (e.g. ``time.time()`` or
+            ``LogRecord.created``).
+
+    Returns:
+        The same string ``datetime.fromtimestamp(t, tz=UTC).isoformat()``
+        would return.
+    """
+    global _prefix_cache
+    sec = int(t)
+    us = round((t - sec) * 1_000_000)
+    if us >= 1_000_000:
+        sec += 1
+        us -= 1_000_000
+
+    cached_sec, prefix = _prefix_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, tz=UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _prefix_cache = (sec, prefix)
+
+    if us:
+        return f"{prefix}.{us:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def iso_now() -> str:
+    """Return the current wall-clock time as an ISO-8601 UTC string."""
+    return iso_utc(time.time())
@@ -6,6 +6,8 @@ All configuration values come from environment variables or .env files;
 no hardcoded IPs, URLs, or credentials.
 
 CHANGELOG:
+- 2026-10-16: Type ENQUEUE_FLUSH_INTERVAL_S as float seconds
+- 2026-10-16: Add opt-in enqueue batching settings
 - 2026-02-14: Add raw debug snapshot configuration for Modbus payload inspection
 - 2026-02-14: Initial creation (STORY-001)
 
@@ -39,6 +41,11 @@ class EdgeSettings(BaseSettings):
         spool_path: SQLite spool file path for local buffering.
         raw_debug_enabled: If True, logs periodic raw register snapshots.
         raw_debug_every_n_polls: Snapshot frequency (every N poll attempts).
+        enqueue_batch_size: Samples buffered in memory before one spool
+            transaction (default 1 = write-through). Values above 1 trade
+            crash durability of the buffered samples for fewer commits.
+        enqueue_flush_interval_s: Maximum seconds (may be fractional) a
+            buffered sample waits before the buffer is flushed to the spool.
     """
 
     sungrow_host: str
@@ -54,6 +61,8 @@ class EdgeSettings(BaseSettings):
     spool_path: str = "/data/spool.db"
     raw_debug_enabled: bool = False
     raw_debug_every_n_polls: int = 60
+    enqueue_batch_size: int = 1
+    enqueue_flush_interval_s: float = 60.0
 
     @model_validator(mode="after")
     def _default_device_id(self) -> "EdgeSettings":
@@ -128,4 +137,20 @@ class EdgeSettings(BaseSettings):
             raise ValueError("RAW_DEBUG_EVERY_N_POLLS must be >= 1")
         return v
 
+    @field_validator("enqueue_batch_size")
+    @classmethod
+    def enqueue_batch_size_must_be_positive(cls, v: int) -> int:
+        """Validate enqueue batch size is positive."""
+        if v < 1:
+            raise ValueError("ENQUEUE_BATCH_SIZE must be >= 1")
+        return v
+
+    @field_validator("enqueue_flush_interval_s")
+    @classmethod
+    def enqueue_flush_interval_must_be_positive(cls, v: float) -> float:
+        """Validate enqueue flush interval is positive."""
+        if v <= 0:
+            raise ValueError("ENQUEUE_FLUSH_INTERVAL_S must be > 0")
+        return v
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
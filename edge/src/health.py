@@ -6,10 +6,23 @@ Writes a JSON health file at a configurable path with three fields:
 - last_upload_ts: ISO timestamp of the most recent successful upload.
 - spool_count: Number of pending samples in the local spool.
 
-The file is overwritten atomically on every state change, providing a
-simple liveness signal that Docker HEALTHCHECK or monitoring can inspect.
+The file is published atomically (write to a sibling temp file, then
+``os.replace``) so the Docker HEALTHCHECK never observes a torn file.
+Writes whose serialized content is identical to the last published
+content are skipped.
+
+While the :meth:`HealthWriter.run` flush coroutine is active, mutators only
+update in-memory state and the coroutine coalesces bursts of updates into
+at most one write per interval.  Without it, every mutator writes
+immediately.
 
 CHANGELOG:
+- 2026-10-16: Mutator docstrings describe the deferred flush
+- 2026-10-16: record_poll() accepts the caller's poll timestamp
+- 2026-10-16: Wake run() immediately on shutdown instead of polling with timeouts
+- 2026-10-16: Format timestamps via the cached clock.iso_now() helper
+- 2026-10-16: Add run() flush coroutine to debounce writes in the daemon
+- 2026-10-16: Atomic publish via temp file + os.replace; skip unchanged writes
 - 2026-02-14: Initial creation (STORY-015)
 
 TODO:
@@ -18,51 +31,143 @@ TODO:
 
 from __future__ import annotations
 
+import asyncio
 import json
-from datetime import UTC, datetime
+import logging
+import os
+from datetime import datetime
 from pathlib import Path
 
+from edge.src.clock import iso_now
+
+logger = logging.getLogger(__name__)
+
 
 class HealthWriter:
     """Writes edge health status to a JSON file.
 
     Each mutating method updates the in-memory state and immediately
     rewrites the health file so it always reflects the latest status.
+    The rewrite is skipped when the serialized state is unchanged.
+    While :meth:`run` is active, writes are deferred to that coroutine.
 
     Args:
         path: Filesystem path for the health JSON file. Accepts str or Path.
+        fsync: If True, fsync the temp file before publishing it. Off by
+            default; the health file is a liveness signal, not durable data.
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(self, path: str | Path, *, fsync: bool = False) -> None:
         self.path = Path(path)
+        self._tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._fsync = fsync
+        self._last_serialized: bytes | None = None
+        self._dirty = asyncio.Event()
+        self._deferred = False
         self._last_poll_ts: str | None = None
         self._last_upload_ts: str | None = None
         self._spool_count: int = 0
 
-    def record_poll(self) -> None:
-        """Record a poll event and write health file."""
-        self._last_poll_ts = datetime.now(tz=UTC).isoformat()
-        self._write()
+    def record_poll(self, ts: datetime | None = None) -> None:
+        """Record a poll event and mark the health file dirty.
+
+        While :meth:`run` is active the write is deferred to its next
+        flush; otherwise the file is written immediately.
+
+        Args:
+            ts: Timezone-aware time of the poll.  Defaults to now; the
+                daemon passes the timestamp it already stamped the sample
+                with so the clock is read once per poll.
+        """
+        self._last_poll_ts = iso_now() if ts is None else ts.isoformat()
+        self._mark_dirty()
 
     def record_upload(self) -> None:
-        """Record an upload event and write health file."""
-        self._last_upload_ts = datetime.now(tz=UTC).isoformat()
-        self._write()
+        """Record an upload event and mark the health file dirty.
+
+        The write is deferred to :meth:`run` while it is active.
+        """
+        self._last_upload_ts = iso_now()
+        self._mark_dirty()
 
     def set_spool_count(self, count: int) -> None:
-        """Update the spool count and write health file.
+        """Update the spool count and mark the health file dirty.
+
+        The write is deferred to :meth:`run` while it is active.
 
         Args:
             count: Current number of pending samples in the spool.
         """
         self._spool_count = count
-        self._write()
+        self._mark_dirty()
+
+    async def run(
+        self,
+        shutdown_event: asyncio.Event,
+        min_interval_s: float,
+    ) -> None:
+        """Flush pending state to disk at most once per *min_interval_s*.
+
+        While this coroutine runs, mutators no longer write synchronously.
+        Runs until *shutdown_event* is set, then flushes any pending state
+        and restores immediate writes.
+
+        Args:
+            shutdown_event: Event that stops the flush loop.
+            min_interval_s: Minimum number of seconds between two writes.
+        """
+        self._deferred = True
+        shutdown_task = asyncio.create_task(shutdown_event.wait())
+        try:
+            while not shutdown_event.is_set():
+                dirty_task = asyncio.create_task(self._dirty.wait())
+                await asyncio.wait(
+                    (dirty_task, shutdown_task),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                dirty_task.cancel()
+                if shutdown_event.is_set():
+                    break
+                self._flush()
+                await asyncio.wait((shutdown_task,), timeout=min_interval_s)
+        finally:
+            shutdown_task.cancel()
+            self._deferred = False
+            if self._dirty.is_set():
+                self._flush()
+
+    def _mark_dirty(self) -> None:
+        """Write now, or hand the write to the running flush coroutine."""
+        if self._deferred:
+            self._dirty.set()
+        else:
+            self._write()
+
+    def _flush(self) -> None:
+        """Write pending state from the flush coroutine, logging failures."""
+        self._dirty.clear()
+        try:
+            self._write()
+        except OSError:
+            logger.warning("Failed to write health file", exc_info=True)
 
     def _write(self) -> None:
-        """Write the health JSON file with current state."""
+        """Atomically publish the health JSON file if the state changed."""
         data = {
             "last_poll_ts": self._last_poll_ts,
             "last_upload_ts": self._last_upload_ts,
             "spool_count": self._spool_count,
         }
-        self.path.write_text(json.dumps(data))
+        encoded = json.dumps(data, separators=(",", ":")).encode()
+        if encoded == self._last_serialized:
+            return
+
+        fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, encoded)
+            if self._fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(self._tmp_path, self.path)
+        self._last_serialized = encoded
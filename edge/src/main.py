@@ -13,10 +13,28 @@ sets a shared asyncio.Event, allowing both loops to finish their current
 iteration and then attempt one final upload flush before exiting.
 
 Structured JSON logging is used for all events. A HealthWriter instance
-tracks last_poll_ts, last_upload_ts, and spool_count, writing a JSON health
-file after each state change.
+tracks last_poll_ts, last_upload_ts, and spool_count; its flush coroutine
+runs alongside both loops and coalesces state changes into at most one
+health file write per interval.
 
 CHANGELOG:
+- 2026-10-16: Log poll success without a redundant isEnabledFor guard
+- 2026-10-16: Remove test-only _poll_once(); tests call _read_poll/_store_poll
+- 2026-10-16: Flush aged enqueue batches every poll; health counts buffered samples
+- 2026-10-16: Close the poller's persistent Modbus connection on exit
+- 2026-10-16: Register shutdown_event.set directly as the signal handler
+- 2026-10-16: Read the wall clock once per poll for the sample and health file
+- 2026-10-16: Skip building filtered per-poll log records
+- 2026-10-16: Cache the per-device poll success log message
+- 2026-10-16: raw_debug_state counts down to the next snapshot instead of modulo
+- 2026-10-16: Hoist raw snapshot keys to _RAW_SNAPSHOT_KEYS; single lookup per key
+- 2026-10-16: Serialize samples via the pre-bound pydantic-core serializer
+- 2026-10-16: Add opt-in _EnqueueBatcher for single-transaction spool writes
+- 2026-10-16: Overlap spool/health work of one poll with the next poll interval
+- 2026-10-16: Race interval sleeps against a persistent shutdown task
+- 2026-10-16: Build JSON log lines from cached level/logger fragments
+- 2026-10-16: Format log timestamps via the cached clock.iso_utc() helper
+- 2026-10-16: Run HealthWriter flush coroutine alongside the loops
 - 2026-02-14: Add periodic raw register snapshot logging for field diagnostics
 - 2026-02-14: Replace inline health writer with HealthWriter (STORY-015)
 - 2026-02-14: Initial creation (STORY-014)
@@ -28,15 +46,18 @@ TODO:
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import json
+import functools
 import logging
 import signal
 import sys
+import time
 from datetime import UTC, datetime
+from json.encoder import encode_basestring_ascii as _json_str
 from typing import TYPE_CHECKING
 
+from edge.src.clock import iso_utc
 from edge.src.health import HealthWriter
+from edge.src.models import SungrowSample
 from edge.src.normalizer import normalize
 
 if TYPE_CHECKING:
@@ -46,6 +67,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_sample_to_json = SungrowSample.__pydantic_serializer__.to_json
+"""Pre-bound pydantic-core serializer; same bytes as ``model_dump_json()``."""
+
 
 # ---------------------------------------------------------------------------
 # Structured JSON logging setup
@@ -59,18 +83,34 @@ def configure_logging() -> None:
     """
 
     class _JsonFormatter(logging.Formatter):
-        """Minimal JSON log formatter."""
+        """Minimal JSON log formatter.
+
+        Produces the same text as ``json.dumps`` of a ts/level/logger/msg
+        dict, but caches the encoded level/logger fragment per pair and
+        only encodes the per-record strings.
+        """
+
+        def __init__(self) -> None:
+            super().__init__()
+            self._fragments: dict[tuple[str, str], str] = {}
 
         def format(self, record: logging.LogRecord) -> str:
-            log_entry = {
-                "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
-                "level": record.levelname,
-                "logger": record.name,
-                "msg": record.getMessage(),
-            }
+            key = (record.levelname, record.name)
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                fragment = (
+                    f'"level": {_json_str(record.levelname)}, '
+                    f'"logger": {_json_str(record.name)}'
+                )
+                self._fragments[key] = fragment
+            line = (
+                f'{{"ts": "{iso_utc(record.created)}", {fragment}, '
+                f'"msg": {_json_str(record.getMessage())}'
+            )
             if record.exc_info and record.exc_info[1] is not None:
-                log_entry["exception"] = self.formatException(record.exc_info)
-            return json.dumps(log_entry)
+                exc_text = self.formatException(record.exc_info)
+                line += f', "exception": {_json_str(exc_text)}'
+            return line + "}"
 
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(_JsonFormatter())
@@ -100,7 +140,8 @@ def log_config_summary(settings: object) -> None:
         "poll_interval_s=%s, upload_interval_s=%s, "
         "inter_register_delay_ms=%s, batch_size=%s, "
         "spool_path=%s, device_id=%s, vps_base_url=%s, "
-        "raw_debug_enabled=%s, raw_debug_every_n_polls=%s",
+        "raw_debug_enabled=%s, raw_debug_every_n_polls=%s, "
+        "enqueue_batch_size=%s, enqueue_flush_interval_s=%s",
         settings.sungrow_host,  # type: ignore[union-attr]
         settings.sungrow_port,  # type: ignore[union-attr]
         settings.sungrow_slave_id,  # type: ignore[union-attr]
@@ -113,80 +154,201 @@ def log_config_summary(settings: object) -> None:
         settings.vps_base_url,  # type: ignore[union-attr]
         settings.raw_debug_enabled,  # type: ignore[union-attr]
         settings.raw_debug_every_n_polls,  # type: ignore[union-attr]
+        settings.enqueue_batch_size,  # type: ignore[union-attr]
+        settings.enqueue_flush_interval_s,  # type: ignore[union-attr]
     )
 
 
+_RAW_SNAPSHOT_KEYS = (
+    "total_dc_power",
+    "daily_pv_generation",
+    "battery_power",
+    "battery_soc",
+    "battery_temperature",
+    "load_power",
+    "grid_power",
+    "export_power",
+)
+"""Register names included in raw debug snapshots."""
+
+
+@functools.cache
+def _poll_success_message(device_id: str) -> str:
+    """Return the preformatted poll success log line for *device_id*.
+
+    device_id is fixed for the daemon's lifetime, so the message is built
+    once instead of being %-formatted on every successful poll.
+    """
+    return f"Poll success: enqueued sample for device={device_id}"
+
+
 def _log_raw_snapshot(raw: dict[str, list[int]]) -> None:
     """Log a compact raw register snapshot for debugging field decoding."""
-    keys = (
-        "total_dc_power",
-        "daily_pv_generation",
-        "battery_power",
-        "battery_soc",
-        "battery_temperature",
-        "load_power",
-        "grid_power",
-        "export_power",
-    )
-    snapshot = {k: raw.get(k) for k in keys if k in raw}
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    snapshot = {k: v for k in _RAW_SNAPSHOT_KEYS if (v := raw.get(k)) is not None}
     logger.warning("Raw register snapshot: %s", snapshot)
 
 
+# ---------------------------------------------------------------------------
+# Enqueue batching
+# ---------------------------------------------------------------------------
+
+
+class _EnqueueBatcher:
+    """Buffers sample payloads and writes them to the spool in batches.
+
+    Payloads are flushed with :meth:`Spool.enqueue_many` (one transaction)
+    once *max_pending* payloads are buffered or the oldest buffered payload
+    is *flush_interval_s* seconds old.  The age check also runs from
+    :meth:`maybe_flush`, which the poll loop calls every cycle, so samples
+    are not held in memory while polls fail.  If a flush fails the payloads
+    stay buffered and are retried on the next flush (HC-001).
+
+    Args:
+        spool: The local spool to flush into.
+        max_pending: Number of buffered payloads that triggers a flush.
+        flush_interval_s: Maximum seconds a payload stays buffered.
+    """
+
+    def __init__(
+        self,
+        spool: Spool,
+        *,
+        max_pending: int,
+        flush_interval_s: float,
+    ) -> None:
+        self._spool = spool
+        self._max_pending = max_pending
+        self._flush_interval_s = flush_interval_s
+        self._pending: list[str] = []
+        self._first_pending_at = 0.0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of payloads buffered but not yet in the spool."""
+        return len(self._pending)
+
+    async def add(self, payload: str) -> None:
+        """Buffer *payload*, flushing if the size or age threshold is hit."""
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+        self._pending.append(payload)
+        if len(self._pending) >= self._max_pending:
+            await self.flush()
+        else:
+            await self.maybe_flush()
+
+    async def maybe_flush(self) -> None:
+        """Flush if the oldest buffered payload has reached the age limit."""
+        if (
+            self._pending
+            and time.monotonic() - self._first_pending_at >= self._flush_interval_s
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered payloads to the spool in one transaction."""
+        if self._pending:
+            batch = self._pending
+            self._pending = []
+            try:
+                await self._spool.enqueue_many(batch)
+            except Exception:
+                self._pending = batch + self._pending
+                raise
+
+
 # ---------------------------------------------------------------------------
 # Single-iteration functions (easily testable)
 # ---------------------------------------------------------------------------
 
 
-async def _poll_once(
+async def _read_poll(poller: Poller) -> dict[str, list[int]] | None:
+    """Read raw registers from the poller, never raising.
+
+    Args:
+        poller: The Modbus poller instance.
+
+    Returns:
+        The raw register dict, or ``None`` if the poll failed.
+    """
+    try:
+        raw = await poller.poll()
+    except Exception:
+        logger.error("Poll cycle error", exc_info=True)
+        return None
+    if raw is None:
+        logger.warning("Poller returned None, skipping normalize and enqueue")
+    return raw
+
+
+async def _store_poll(
+    raw: dict[str, list[int]] | None,
     *,
-    poller: Poller,
     spool: Spool,
     device_id: str,
     health: HealthWriter | None,
     raw_debug_enabled: bool = False,
     raw_debug_every_n_polls: int = 60,
     raw_debug_state: list[int] | None = None,
+    batcher: _EnqueueBatcher | None = None,
 ) -> None:
-    """Execute a single poll-normalize-enqueue cycle.
+    """Normalize and enqueue one poll result, then update the health file.
 
     Catches all exceptions so that the caller's loop is never broken.
-    After each poll attempt the health writer is updated with the current
-    spool count and a fresh poll timestamp.
+    The health writer is updated even when *raw* is ``None``.
 
     Args:
-        poller: The Modbus poller instance.
+        raw: Raw register dict from :func:`_read_poll`, or ``None``.
         spool: The local spool for buffering.
         device_id: Device identifier for the sample.
         health: HealthWriter instance, or None to skip health writes.
+        raw_debug_state: One-element countdown of polls remaining until
+            the next raw snapshot; reset to *raw_debug_every_n_polls*.
+        batcher: Optional enqueue batcher; when None each sample is
+            written to the spool immediately.  Its age limit is checked
+            on every call, and buffered samples count towards the
+            health spool count.
     """
-    try:
-        raw = await poller.poll()
-
-        if raw is not None:
+    ts = datetime.now(tz=UTC)
+    if raw is not None:
+        try:
             if raw_debug_enabled and raw_debug_state is not None:
-                raw_debug_state[0] += 1
-                if raw_debug_state[0] % raw_debug_every_n_polls == 0:
+                raw_debug_state[0] -= 1
+                if raw_debug_state[0] <= 0:
+                    raw_debug_state[0] = raw_debug_every_n_polls
                     _log_raw_snapshot(raw)
 
-            ts = datetime.now(tz=UTC)
             sample = normalize(raw, device_id=device_id, ts=ts)
 
             if sample is not None:
-                await spool.enqueue(sample.model_dump_json())
-                logger.info("Poll success: enqueued sample for device=%s", device_id)
+                payload = _sample_to_json(sample).decode()
+                if batcher is None:
+                    await spool.enqueue(payload)
+                else:
+                    await batcher.add(payload)
+                logger.info(_poll_success_message(device_id))
             else:
                 logger.warning("Normalizer returned None, skipping enqueue")
-        else:
-            logger.warning("Poller returned None, skipping normalize and enqueue")
-    except Exception:
-        logger.error("Poll cycle error", exc_info=True)
+        except Exception:
+            logger.error("Poll cycle error", exc_info=True)
+
+    # Age-based flush runs even when this poll produced no sample
+    if batcher is not None:
+        try:
+            await batcher.maybe_flush()
+        except Exception:
+            logger.error("Enqueue batch flush failed", exc_info=True)
 
     # Update health file after every poll attempt (success or failure)
     if health is not None:
         try:
             count = await spool.count()
+            if batcher is not None:
+                count += batcher.pending_count
             health.set_spool_count(count)
-            health.record_poll()
+            health.record_poll(ts)
         except Exception:
             logger.warning("Failed to write health file", exc_info=True)
 
@@ -239,11 +401,19 @@ async def _poll_loop(
     health: HealthWriter | None,
     raw_debug_enabled: bool = False,
     raw_debug_every_n_polls: int = 60,
+    enqueue_batch_size: int = 1,
+    enqueue_flush_interval_s: float = 60.0,
 ) -> None:
     """Run the poll loop until shutdown_event is set.
 
-    Executes _poll_once, then sleeps for poll_interval_s, checking the
-    shutdown event between iterations.
+    Reads the poller, then hands the result to :func:`_store_poll` as a
+    background task and immediately starts the interval sleep, so spool
+    and health I/O overlap with the wait for the next poll instead of
+    delaying it.  Stores are serialized to keep FIFO order, and the last
+    one is awaited before the loop returns.
+
+    The sleep is raced against a single long-lived shutdown-wait task, so
+    shutdown wakes the loop immediately without per-iteration timeout churn.
 
     Args:
         poller: The Modbus poller instance.
@@ -252,25 +422,56 @@ async def _poll_loop(
         poll_interval_s: Seconds between poll cycles.
         shutdown_event: Event to signal graceful shutdown.
         health: HealthWriter instance, or None to skip health writes.
+        enqueue_batch_size: Samples per spool transaction; 1 writes each
+            sample through immediately.
+        enqueue_flush_interval_s: Maximum age of buffered samples.
     """
     logger.info("Poll loop started (interval=%ss)", poll_interval_s)
-    raw_debug_state = [0]
-    while not shutdown_event.is_set():
-        await _poll_once(
-            poller=poller,
-            spool=spool,
-            device_id=device_id,
-            health=health,
-            raw_debug_enabled=raw_debug_enabled,
-            raw_debug_every_n_polls=raw_debug_every_n_polls,
-            raw_debug_state=raw_debug_state,
+    raw_debug_state = [raw_debug_every_n_polls]
+    batcher = (
+        _EnqueueBatcher(
+            spool,
+            max_pending=enqueue_batch_size,
+            flush_interval_s=enqueue_flush_interval_s,
         )
-        # Use wait with timeout so we can check shutdown between sleeps
-        with contextlib.suppress(TimeoutError):
-            await asyncio.wait_for(
-                shutdown_event.wait(),
-                timeout=poll_interval_s,
+        if enqueue_batch_size > 1
+        else None
+    )
+    shutdown_task = asyncio.create_task(shutdown_event.wait())
+    store_task: asyncio.Task[None] | None = None
+    try:
+        while not shutdown_event.is_set():
+            raw = await _read_poll(poller)
+            # Stores run one at a time so the spool stays in poll order.
+            if store_task is not None:
+                await store_task
+            store_task = asyncio.create_task(
+                _store_poll(
+                    raw,
+                    spool=spool,
+                    device_id=device_id,
+                    health=health,
+                    raw_debug_enabled=raw_debug_enabled,
+                    raw_debug_every_n_polls=raw_debug_every_n_polls,
+                    raw_debug_state=raw_debug_state,
+                    batcher=batcher,
+                )
             )
+            # Sleep for the interval, waking early if shutdown is signalled
+            await asyncio.wait((shutdown_task,), timeout=poll_interval_s)
+    finally:
+        shutdown_task.cancel()
+        if store_task is not None:
+            await store_task
+        if batcher is not None:
+            try:
+                await batcher.flush()
+            except Exception:
+                logger.error(
+                    "Failed to flush %d buffered samples on shutdown",
+                    batcher.pending_count,
+                    exc_info=True,
+                )
     logger.info("Poll loop stopped")
 
 
@@ -284,8 +485,8 @@ async def _upload_loop(
 ) -> None:
     """Run the upload loop until shutdown_event is set.
 
-    Executes _upload_once, then sleeps for upload_interval_s, checking the
-    shutdown event between iterations.
+    Executes _upload_once, then sleeps for upload_interval_s, waking early
+    on shutdown (same long-lived shutdown-wait task as _poll_loop).
 
     Args:
         uploader: The HTTPS batch uploader.
@@ -295,14 +496,14 @@ async def _upload_loop(
         health: HealthWriter instance, or None to skip health writes.
     """
     logger.info("Upload loop started (interval=%ss)", upload_interval_s)
-    while not shutdown_event.is_set():
-        await _upload_once(uploader=uploader, spool=spool, health=health)
-        # Use wait with timeout so we can check shutdown between sleeps
-        with contextlib.suppress(TimeoutError):
-            await asyncio.wait_for(
-                shutdown_event.wait(),
-                timeout=upload_interval_s,
-            )
+    shutdown_task = asyncio.create_task(shutdown_event.wait())
+    try:
+        while not shutdown_event.is_set():
+            await _upload_once(uploader=uploader, spool=spool, health=health)
+            # Sleep for the interval, waking early if shutdown is signalled
+            await asyncio.wait((shutdown_task,), timeout=upload_interval_s)
+    finally:
+        shutdown_task.cancel()
     logger.info("Upload loop stopped")
 
 
@@ -323,10 +524,13 @@ async def run_loops(
     health: HealthWriter | None = None,
     raw_debug_enabled: bool = False,
     raw_debug_every_n_polls: int = 60,
+    enqueue_batch_size: int = 1,
+    enqueue_flush_interval_s: float = 60.0,
 ) -> None:
     """Run poll and upload loops concurrently until shutdown.
 
-    Both loops run as independent asyncio tasks via asyncio.gather().
+    Both loops run as independent asyncio tasks via asyncio.gather(),
+    together with the health writer's flush coroutine when *health* is set.
     When the shutdown_event is set, both loops finish their current iteration,
     then a final upload flush is attempted before returning.
 
@@ -342,7 +546,7 @@ async def run_loops(
     """
     logger.info("Starting concurrent poll and upload loops")
 
-    await asyncio.gather(
+    coros = [
         _poll_loop(
             poller=poller,
             spool=spool,
@@ -352,6 +556,8 @@ async def run_loops(
             health=health,
             raw_debug_enabled=raw_debug_enabled,
             raw_debug_every_n_polls=raw_debug_every_n_polls,
+            enqueue_batch_size=enqueue_batch_size,
+            enqueue_flush_interval_s=enqueue_flush_interval_s,
         ),
         _upload_loop(
             uploader=uploader,
@@ -360,7 +566,16 @@ async def run_loops(
             shutdown_event=shutdown_event,
             health=health,
         ),
-    )
+    ]
+    if health is not None:
+        coros.append(
+            health.run(
+                shutdown_event,
+                min_interval_s=min(poll_interval_s, upload_interval_s),
+            )
+        )
+    await asyncio.gather(*coros)
+    logger.info("Shutdown requested, loops stopped")
 
     # Final upload flush after shutdown
     logger.info("Attempting final upload flush before exit")
@@ -390,12 +605,11 @@ async def async_main() -> None:
 
     shutdown_event = asyncio.Event()
 
+    # Event.set() is idempotent, so repeated signals are harmless.  The
+    # shutdown is logged by run_loops() once the loops have woken up.
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(
-            sig,
-            lambda: _handle_signal(shutdown_event),
-        )
+        loop.add_signal_handler(sig, shutdown_event.set)
 
     poller = Poller(
         host=settings.sungrow_host,
@@ -412,29 +626,24 @@ async def async_main() -> None:
 
     health = HealthWriter("/data/health.json")
 
-    async with Spool(settings.spool_path) as spool:
-        await run_loops(
-            poller=poller,
-            spool=spool,
-            uploader=uploader,
-            device_id=settings.device_id,
-            poll_interval_s=settings.poll_interval_s,
-            upload_interval_s=settings.upload_interval_s,
-            shutdown_event=shutdown_event,
-            health=health,
-            raw_debug_enabled=settings.raw_debug_enabled,
-            raw_debug_every_n_polls=settings.raw_debug_every_n_polls,
-        )
-
-
-def _handle_signal(shutdown_event: asyncio.Event) -> None:
-    """Handle SIGTERM/SIGINT by setting the shutdown event.
-
-    Args:
-        shutdown_event: The event to set for graceful shutdown.
-    """
-    logger.info("Received shutdown signal, initiating graceful shutdown")
-    shutdown_event.set()
+    try:
+        async with Spool(settings.spool_path) as spool:
+            await run_loops(
+                poller=poller,
+                spool=spool,
+                uploader=uploader,
+                device_id=settings.device_id,
+                poll_interval_s=settings.poll_interval_s,
+                upload_interval_s=settings.upload_interval_s,
+                shutdown_event=shutdown_event,
+                health=health,
+                raw_debug_enabled=settings.raw_debug_enabled,
+                raw_debug_every_n_polls=settings.raw_debug_every_n_polls,
+                enqueue_batch_size=settings.enqueue_batch_size,
+                enqueue_flush_interval_s=settings.enqueue_flush_interval_s,
+            )
+    finally:
+        poller.close()
 
 
 def main() -> None:
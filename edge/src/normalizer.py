@@ -13,6 +13,12 @@ This is a pure function: no side effects, no I/O, no clock.  The device_id
 and timestamp are accepted as parameters so they can be injected by the caller.
 
 CHANGELOG:
+- 2026-10-16: Remove _convert_u16/_convert_u32/_convert_s32; extractors inline them
+- 2026-10-16: Fail at import on an unresolvable _FIELD_MAP entry; drop hot-path check
+- 2026-10-16: Validate raw word counts once per poll; extractors assume valid shape
+- 2026-10-16: Inline U16/S16/U32/S32 conversions into type-specific extractors
+- 2026-10-16: Specialize register extraction into per-register closures
+- 2026-10-16: Precompute (field, RegisterDef) plan and grid_power fallback at import
 - 2026-02-18: Revert to battery_power single register and -grid_power fallback
 - 2026-02-14: Add S32 fallback decoder for devices exposing legacy S16 in low word
 - 2026-02-14: Fallback export_power_w to -grid_power when export register is missing
@@ -25,7 +31,10 @@ TODO:
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
+from collections.abc import Callable
 from datetime import datetime
 
 from edge.src.models import SungrowSample
@@ -52,16 +61,43 @@ _FIELD_MAP: dict[str, str] = {
 """Maps SungrowSample field name -> register name in ALL_REGISTERS."""
 
 
+Extractor = Callable[[dict[str, list[int]]], float | None]
+"""A register-specialised function mapping the raw dict to a scaled value."""
+
+
+def _build_normalize_plan(
+    field_map: dict[str, str],
+    registers: dict[str, RegisterDef],
+) -> tuple[tuple[str, str, Extractor, bool], ...]:
+    """Resolve *field_map* against *registers* once, at import time.
+
+    A field mapped to an unknown register is a static configuration error,
+    so it raises here instead of being re-checked on every poll.
+
+    Returns:
+        Tuple of ``(field_name, reg_name, extract, is_export)`` where
+        *extract* is the register's specialised extractor and *is_export*
+        flags the field that uses the -grid_power fallback.
+
+    Raises:
+        KeyError: If a mapped register is not in *registers*.
+    """
+    plan: list[tuple[str, str, Extractor, bool]] = []
+    for field_name, reg_name in field_map.items():
+        reg_def = registers.get(reg_name)
+        if reg_def is None:
+            msg = f"Field '{field_name}' maps to unknown register '{reg_name}'"
+            raise KeyError(msg)
+        extract = _make_extractor(reg_def)
+        plan.append((field_name, reg_name, extract, field_name == "export_power_w"))
+    return tuple(plan)
+
+
 # ---------------------------------------------------------------------------
 # Type conversion helpers
 # ---------------------------------------------------------------------------
 
 
-def _convert_u16(raw: int) -> int:
-    """Interpret a raw value as unsigned 16-bit (no conversion needed)."""
-    return raw & 0xFFFF
-
-
 def _convert_s16(raw: int) -> int:
     """Interpret a raw 16-bit value as signed (two's complement)."""
     val = raw & 0xFFFF
@@ -70,22 +106,171 @@ def _convert_s16(raw: int) -> int:
     return val
 
 
-def _convert_u32(hi: int, lo: int) -> int:
-    """Assemble two U16 registers (high word first) into unsigned 32-bit."""
-    return ((hi & 0xFFFF) << 16) | (lo & 0xFFFF)
+# ---------------------------------------------------------------------------
+# Core: per-register extractors, specialised once per RegisterDef
+# ---------------------------------------------------------------------------
 
 
-def _convert_s32(hi: int, lo: int) -> int:
-    """Assemble two U16 registers (high word first) into signed 32-bit."""
-    val = ((hi & 0xFFFF) << 16) | (lo & 0xFFFF)
-    if val >= 0x80000000:
-        val -= 0x100000000
-    return val
+def _log_missing(name: str) -> None:
+    """Log a register absent from the raw dict."""
+    logger.warning("Register '%s': missing from raw data", name)
 
 
-# ---------------------------------------------------------------------------
-# Core: extract a single register value from the raw dict
-# ---------------------------------------------------------------------------
+def _log_short(name: str, reg_type: str, expected: int, got: int) -> None:
+    """Log a register whose word list is shorter than its type requires."""
+    logger.warning(
+        "Register '%s': expected %d word%s for %s, got %d",
+        name,
+        expected,
+        "" if expected == 1 else "s",
+        reg_type,
+        got,
+    )
+
+
+def _log_out_of_range(
+    name: str,
+    scaled: float,
+    words: list[int],
+    lo: float,
+    hi: float,
+) -> None:
+    """Log a scaled value that fell outside the register's valid range."""
+    logger.warning(
+        "Register '%s': scaled value %.4g (raw words=%s) outside valid range (%s, %s)",
+        name,
+        scaled,
+        words,
+        lo,
+        hi,
+    )
+
+
+@functools.cache
+def _make_extractor(reg_def: RegisterDef) -> Extractor:
+    """Build an extractor specialised for one register definition.
+
+    Type dispatch, range presence, and the S32 low-word fallback are
+    decided here once.  The returned closure has the two's-complement
+    conversion for its type inlined (no helper call) and only looks up
+    the words, converts, scales, and range-checks them.
+
+    The extractor takes the poller's raw dict and returns the scaled float
+    value, or ``None`` if the register is missing or the scaled value
+    falls outside its valid_range.  It assumes the register's word list
+    is at least ``reg_def.word_count`` long; callers validate the shape
+    first (see :func:`_check_shape`).
+    """
+    name = reg_def.name
+    reg_type = reg_def.reg_type
+    scale = reg_def.scale
+    if reg_def.valid_range is not None:
+        lo, hi = reg_def.valid_range
+    else:
+        lo, hi = -math.inf, math.inf
+
+    def extract_u16(raw: dict[str, list[int]]) -> float | None:
+        words = raw.get(name)
+        if words is None:
+            _log_missing(name)
+            return None
+        scaled = (words[0] & 0xFFFF) * scale
+        if lo <= scaled <= hi:
+            return scaled
+        _log_out_of_range(name, scaled, words, lo, hi)
+        return None
+
+    def extract_s16(raw: dict[str, list[int]]) -> float | None:
+        words = raw.get(name)
+        if words is None:
+            _log_missing(name)
+            return None
+        val = words[0] & 0xFFFF
+        if val >= 0x8000:
+            val -= 0x10000
+        scaled = val * scale
+        if lo <= scaled <= hi:
+            return scaled
+        _log_out_of_range(name, scaled, words, lo, hi)
+        return None
+
+    def extract_u32(raw: dict[str, list[int]]) -> float | None:
+        words = raw.get(name)
+        if words is None:
+            _log_missing(name)
+            return None
+        scaled = (((words[0] & 0xFFFF) << 16) | (words[1] & 0xFFFF)) * scale
+        if lo <= scaled <= hi:
+            return scaled
+        _log_out_of_range(name, scaled, words, lo, hi)
+        return None
+
+    def extract_s32(raw: dict[str, list[int]]) -> float | None:
+        words = raw.get(name)
+        if words is None:
+            _log_missing(name)
+            return None
+        hi_word = words[0]
+        val = ((hi_word & 0xFFFF) << 16) | (words[1] & 0xFFFF)
+        if val >= 0x80000000:
+            val -= 0x100000000
+        scaled = val * scale
+        if lo <= scaled <= hi:
+            return scaled
+        # Some inverter firmwares expose S16 values in the low word while
+        # still returning 2 words for documented S32 registers.
+        # Example observed on load_power: [0, 62000].
+        if hi_word in (0, 0xFFFF):
+            alt_scaled = _convert_s16(words[1]) * scale
+            if lo <= alt_scaled <= hi:
+                logger.warning(
+                    "Register '%s': S32 out-of-range %.4g from words=%s; "
+                    "using legacy low-word S16 fallback %.4g",
+                    name,
+                    scaled,
+                    words,
+                    alt_scaled,
+                )
+                return alt_scaled
+        _log_out_of_range(name, scaled, words, lo, hi)
+        return None
+
+    def extract_unsupported(raw: dict[str, list[int]]) -> float | None:
+        if name not in raw:
+            _log_missing(name)
+            return None
+        logger.warning("Register '%s': unsupported type '%s'", name, reg_type)
+        return None
+
+    extractors: dict[str, Extractor] = {
+        "U16": extract_u16,
+        "S16": extract_s16,
+        "U32": extract_u32,
+        "S32": extract_s32,
+    }
+    return extractors.get(reg_type, extract_unsupported)
+
+
+def _check_shape(
+    shapes: tuple[tuple[str, str, int], ...],
+    raw: dict[str, list[int]],
+) -> bool:
+    """Check that every present register in *shapes* has enough words.
+
+    Args:
+        shapes: ``(reg_name, reg_type, word_count)`` triples to check.
+        raw: The poller's raw register dict.
+
+    Returns:
+        ``False`` (after logging) on the first register whose word list is
+        shorter than its word_count; absent registers are not an error here.
+    """
+    for name, reg_type, expected in shapes:
+        words = raw.get(name)
+        if words is not None and len(words) < expected:
+            _log_short(name, reg_type, expected, len(words))
+            return False
+    return True
 
 
 def _extract_value(
@@ -94,87 +279,29 @@ def _extract_value(
 ) -> float | None:
     """Extract, type-convert, and scale a single register value.
 
-    The *raw* dict maps register names to word lists as produced by the
-    poller: 1-element lists for U16/S16, 2-element lists for U32/S32.
+    Checks the register's word count, then calls the cached extractor
+    from :func:`_make_extractor`.
 
     Returns the scaled float value, or ``None`` if the required raw
     key is missing, has wrong word count, or the scaled value falls
     outside the register's valid_range.
     """
-    name = reg_def.name
-    reg_type = reg_def.reg_type
-
-    if name not in raw:
-        logger.warning("Register '%s': missing from raw data", name)
+    if not _check_shape(((reg_def.name, reg_def.reg_type, reg_def.word_count),), raw):
         return None
+    return _make_extractor(reg_def)(raw)
 
-    words = raw[name]
-
-    # --- Retrieve raw integer(s) ---
-    if reg_type in ("U32", "S32"):
-        if len(words) < 2:
-            logger.warning(
-                "Register '%s': expected 2 words for %s, got %d",
-                name,
-                reg_type,
-                len(words),
-            )
-            return None
-        hi_val, lo_val = words[0], words[1]
-        if reg_type == "U32":
-            raw_int = _convert_u32(hi_val, lo_val)
-        else:
-            raw_int = _convert_s32(hi_val, lo_val)
-    elif reg_type in ("U16", "S16"):
-        if len(words) < 1:
-            logger.warning(
-                "Register '%s': expected 1 word for %s, got 0",
-                name,
-                reg_type,
-            )
-            return None
-        raw_val = words[0]
-        raw_int = _convert_u16(raw_val) if reg_type == "U16" else _convert_s16(raw_val)
-    else:
-        logger.warning("Register '%s': unsupported type '%s'", name, reg_type)
-        return None
 
-    # --- Apply scaling ---
-    scaled = raw_int * reg_def.scale
+_NORMALIZE_PLAN = _build_normalize_plan(_FIELD_MAP, ALL_REGISTERS)
+"""Precomputed normalize() iteration order; see _build_normalize_plan()."""
 
-    # --- Range validation ---
-    if reg_def.valid_range is not None:
-        lo, hi = reg_def.valid_range
-        if not (lo <= scaled <= hi):
-            # Some inverter firmwares expose S16 values in the low word while
-            # still returning 2 words for documented S32 registers.
-            # Example observed on load_power: [0, 62000].
-            if reg_type == "S32" and len(words) >= 2 and words[0] in (0, 0xFFFF):
-                alt_raw_int = _convert_s16(words[1])
-                alt_scaled = alt_raw_int * reg_def.scale
-                if lo <= alt_scaled <= hi:
-                    logger.warning(
-                        "Register '%s': S32 out-of-range %.4g from words=%s; "
-                        "using legacy low-word S16 fallback %.4g",
-                        name,
-                        scaled,
-                        words,
-                        alt_scaled,
-                    )
-                    return alt_scaled
-
-            logger.warning(
-                "Register '%s': scaled value %.4g "
-                "(raw words=%s) outside valid range (%s, %s)",
-                name,
-                scaled,
-                words,
-                lo,
-                hi,
-            )
-            return None
+_EXPECTED_WORDS: tuple[tuple[str, str, int], ...] = tuple(
+    (reg.name, reg.reg_type, reg.word_count)
+    for reg in (ALL_REGISTERS[reg_name] for reg_name in _FIELD_MAP.values())
+)
+"""``(reg_name, reg_type, word_count)`` for every register normalize() reads."""
 
-    return scaled
+_GRID_REG: RegisterDef | None = ALL_REGISTERS.get("grid_power")
+"""The grid_power register used by the export fallback."""
 
 
 # ---------------------------------------------------------------------------
@@ -207,28 +334,26 @@ def normalize(
     """
     fields: dict[str, float] = {}
 
-    for field_name, reg_name in _FIELD_MAP.items():
-        reg_def = ALL_REGISTERS.get(reg_name)
-        if reg_def is None:
-            logger.warning("Register '%s' not found in ALL_REGISTERS", reg_name)
-            return None
+    # Reject malformed polls up front so the extractors can skip per-field
+    # length checks.
+    if not _check_shape(_EXPECTED_WORDS, raw):
+        return None
 
+    for field_name, reg_name, extract, is_export in _NORMALIZE_PLAN:
         # Some inverters do not expose export_power (register 5083).
         # Use grid_power fallback (positive import / negative export), so
         # export_power_w = -grid_power.
-        if field_name == "export_power_w" and reg_name not in raw:
-            grid_reg = ALL_REGISTERS.get("grid_power")
-            if grid_reg is not None:
-                grid_value = _extract_value(grid_reg, raw)
-                if grid_value is not None:
-                    fields[field_name] = -grid_value
-                    logger.warning(
-                        "Register '%s' missing; falling back to -grid_power",
-                        reg_name,
-                    )
-                    continue
-
-        value = _extract_value(reg_def, raw)
+        if is_export and reg_name not in raw and _GRID_REG is not None:
+            grid_value = _extract_value(_GRID_REG, raw)
+            if grid_value is not None:
+                fields[field_name] = -grid_value
+                logger.warning(
+                    "Register '%s' missing; falling back to -grid_power",
+                    reg_name,
+                )
+                continue
+
+        value = extract(raw)
         if value is None:
             return None
 
@@ -5,12 +5,23 @@ Connects to the WiNet-S Modbus TCP dongle, reads all register groups defined
 in registers.py with configurable inter-register delays, and returns raw
 register values as a dict.  Designed to be robust:
 
-- Exponential backoff on connection failures (capped at MAX_BACKOFF_S).
+- Exponential backoff with equal jitter on connection failures (capped at
+  MAX_BACKOFF_S).
+- :class:`Poller` keeps its TCP connection open across polls and only
+  reconnects after an error or every ``max_reuse`` polls.
 - Never crashes the poll loop on any error.
 - Respects inter-register delay (HC-004: minimum 20 ms between group reads).
 - Logs warnings on errors but never propagates exceptions to the caller.
 
 CHANGELOG:
+- 2026-10-16: Read ALL_GROUPS again; POLL_GROUPS coalescing removed
+- 2026-10-16: Extract the backoff formula into _compute_backoff()
+- 2026-10-16: Precompute a per-group _READ_PLAN; Poller caches its delay in seconds
+- 2026-10-16: Shift-based backoff with bounded exponent and equal jitter
+- 2026-10-16: Poller reuses its Modbus connection across polls
+- 2026-10-16: Cache per-group (name, start, end) slice plans for response extraction
+- 2026-10-16: Read the coalesced POLL_GROUPS; optional groups flagged in registers.py
+- 2026-10-16: Count response handling toward the inter-register delay
 - 2026-02-14: Allow polling to continue when optional export group is unsupported
 - 2026-02-14: Initial creation (STORY-003)
 
@@ -22,7 +33,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+import random
+from typing import TYPE_CHECKING, NamedTuple
 
 from edge.src.registers import ALL_GROUPS
 from pymodbus.client import AsyncModbusTcpClient
@@ -45,6 +57,55 @@ MAX_BACKOFF_S: float = 60.0
 MODBUS_TIMEOUT_S: float = 10.0
 """Timeout per Modbus TCP request in seconds (WiNet-S guideline)."""
 
+DEFAULT_MAX_REUSE: int = 720
+"""Polls served by one connection before a fresh one is opened (~1 h at 5 s)."""
+
+
+# ---------------------------------------------------------------------------
+# Read plan: everything _do_poll needs per group, resolved once at import
+# ---------------------------------------------------------------------------
+
+
+class _GroupRead(NamedTuple):
+    """One Modbus read of the poll sequence and how to slice its response."""
+
+    name: str
+    start_address: int
+    count: int
+    optional: bool
+    slices: tuple[tuple[str, int, int], ...]
+    """``(register_name, start, end)`` word offsets within the response."""
+
+
+def _build_read_plan(groups: list[RegisterGroup]) -> tuple[_GroupRead, ...]:
+    """Resolve *groups* into read parameters and per-register slice bounds.
+
+    Each register's words are determined by its address offset within the
+    group and its ``word_count``; this only depends on the static register
+    map, so it is computed once instead of on every poll.
+    """
+    return tuple(
+        _GroupRead(
+            name=group.group_name,
+            start_address=group.start_address,
+            count=group.count,
+            optional=group.optional,
+            slices=tuple(
+                (
+                    reg.name,
+                    reg.address - group.start_address,
+                    reg.address - group.start_address + reg.word_count,
+                )
+                for reg in group.registers
+            ),
+        )
+        for group in groups
+    )
+
+
+_READ_PLAN: tuple[_GroupRead, ...] = _build_read_plan(ALL_GROUPS)
+"""The reads _do_poll issues, in order."""
+
 
 # ---------------------------------------------------------------------------
 # Stateless single-poll function
@@ -80,7 +141,7 @@ async def poll_registers(
         return await _do_poll(
             client,
             slave_id=slave_id,
-            inter_register_delay_ms=inter_register_delay_ms,
+            delay_s=inter_register_delay_ms / 1000.0,
         )
     except Exception:
         logger.warning(
@@ -99,6 +160,18 @@ async def poll_registers(
 # ---------------------------------------------------------------------------
 
 
+def _compute_backoff(consecutive_failures: int) -> float:
+    """Return the jittered backoff delay after *consecutive_failures* (>= 1).
+
+    Bounded shift instead of 2 ** n, so long outages cannot grow huge ints.
+    Equal jitter (50-100 % of the step) spreads out reconnects of several
+    edges while keeping delays increasing.
+    """
+    shift = min(consecutive_failures - 1, 30)
+    delay = min(BASE_BACKOFF_S * (1 << shift), MAX_BACKOFF_S)
+    return delay * (0.5 + 0.5 * random.random())
+
+
 class Poller:
     """Stateful Modbus TCP poller with exponential backoff.
 
@@ -106,11 +179,17 @@ class Poller:
     cause an exponentially growing sleep before the next attempt.  The
     backoff resets to zero after any successful poll.
 
+    The Modbus TCP connection is kept open between polls.  It is dropped
+    after any failed poll (so the next attempt reconnects, after backoff)
+    and after *max_reuse* successful polls, in case the WiNet-S silently
+    stops serving long-lived sockets.  Call :meth:`close` on shutdown.
+
     Args:
         host: WiNet-S dongle IP address or hostname.
         port: Modbus TCP port (default 502).
         slave_id: Modbus slave / unit ID (default 1).
         inter_register_delay_ms: Milliseconds between group reads (HC-004).
+        max_reuse: Polls served by one connection before reconnecting.
     """
 
     def __init__(
@@ -120,12 +199,23 @@ class Poller:
         port: int = 502,
         slave_id: int = 1,
         inter_register_delay_ms: int = 20,
+        max_reuse: int = DEFAULT_MAX_REUSE,
     ) -> None:
         self._host = host
         self._port = port
         self._slave_id = slave_id
-        self._inter_register_delay_ms = inter_register_delay_ms
+        self._delay_s = inter_register_delay_ms / 1000.0
+        self._max_reuse = max_reuse
         self._consecutive_failures: int = 0
+        self._client: AsyncModbusTcpClient | None = None
+        self._client_polls: int = 0
+
+    def close(self) -> None:
+        """Close the cached Modbus connection, if any."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        self._client_polls = 0
 
     async def poll(self) -> dict[str, list[int]] | None:
         """Execute a single poll cycle with backoff on failure.
@@ -140,10 +230,7 @@ class Poller:
         """
         # Apply backoff sleep before retrying after previous failures.
         if self._consecutive_failures > 0:
-            delay = min(
-                BASE_BACKOFF_S * (2 ** (self._consecutive_failures - 1)),
-                MAX_BACKOFF_S,
-            )
+            delay = _compute_backoff(self._consecutive_failures)
             logger.warning(
                 "Backoff: sleeping %.1fs before retry (consecutive failures: %d)",
                 delay,
@@ -151,16 +238,22 @@ class Poller:
             )
             await asyncio.sleep(delay)
 
-        client = AsyncModbusTcpClient(
-            self._host,
-            port=self._port,
-            timeout=MODBUS_TIMEOUT_S,
-        )
+        client = self._client
+        connect = client is None or not client.connected
+        if client is None:
+            client = AsyncModbusTcpClient(
+                self._host,
+                port=self._port,
+                timeout=MODBUS_TIMEOUT_S,
+            )
+            self._client = client
+            self._client_polls = 0
         try:
             result = await _do_poll(
                 client,
                 slave_id=self._slave_id,
-                inter_register_delay_ms=self._inter_register_delay_ms,
+                delay_s=self._delay_s,
+                connect=connect,
             )
         except Exception:
             logger.warning(
@@ -170,13 +263,15 @@ class Poller:
                 exc_info=True,
             )
             result = None
-        finally:
-            client.close()
 
         if result is not None:
             self._consecutive_failures = 0
+            self._client_polls += 1
+            if self._client_polls >= self._max_reuse:
+                self.close()
         else:
             self._consecutive_failures += 1
+            self.close()
 
         return result
 
@@ -190,86 +285,83 @@ async def _do_poll(
     client: AsyncModbusTcpClient,
     *,
     slave_id: int,
-    inter_register_delay_ms: int,
+    delay_s: float,
+    connect: bool = True,
 ) -> dict[str, list[int]] | None:
     """Execute the actual poll sequence on an already-created client.
 
     Args:
-        client: An AsyncModbusTcpClient instance (not yet connected).
+        client: An AsyncModbusTcpClient instance.
         slave_id: Modbus slave / unit ID to pass as ``device_id``.
-        inter_register_delay_ms: Inter-group delay in milliseconds.
+        delay_s: Inter-group delay in seconds.
+        connect: Connect *client* first; False when it is already
+            connected from a previous poll.
 
     Returns:
         Complete register dict on success, or ``None`` on any error.
     """
     # -- Connect --
-    try:
-        ok = await client.connect()
-    except Exception:
-        logger.warning(
-            "Failed to connect to Modbus device",
-            exc_info=True,
-        )
-        return None
+    if connect:
+        try:
+            ok = await client.connect()
+        except Exception:
+            logger.warning(
+                "Failed to connect to Modbus device",
+                exc_info=True,
+            )
+            return None
 
-    if not ok:
-        logger.warning("Failed to connect to Modbus device (connect returned False)")
-        return None
+        if not ok:
+            logger.warning(
+                "Failed to connect to Modbus device (connect returned False)"
+            )
+            return None
 
     # -- Read all groups --
-    delay_s = inter_register_delay_ms / 1000.0
+    # Reads are deliberately sequential on one connection: the WiNet-S
+    # cannot take concurrent or back-to-back requests (HC-004).  The gap is
+    # measured from the previous response, so the time spent handling that
+    # response already counts toward the delay.
+    loop = asyncio.get_running_loop()
     result: dict[str, list[int]] = {}
+    next_read_at: float | None = None
 
-    for idx, group in enumerate(ALL_GROUPS):
+    for name, start_address, count, optional, slices in _READ_PLAN:
         # Inter-register delay between groups (not before the first read)
-        if idx > 0 and delay_s > 0:
-            await asyncio.sleep(delay_s)
+        if next_read_at is not None:
+            remaining = next_read_at - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
 
         response = await client.read_input_registers(
-            group.start_address,
-            count=group.count,
+            start_address,
+            count=count,
             device_id=slave_id,
         )
+        if delay_s > 0:
+            next_read_at = loop.time() + delay_s
 
         if response.isError():
-            if group.group_name == "export":
+            if optional:
                 logger.warning(
                     "Modbus error reading optional group '%s' "
-                    "(address=%d, count=%d), continuing without export register",
-                    group.group_name,
-                    group.start_address,
-                    group.count,
+                    "(address=%d, count=%d), continuing without its registers",
+                    name,
+                    start_address,
+                    count,
                 )
                 continue
             logger.warning(
                 "Modbus error reading group '%s' (address=%d, count=%d)",
-                group.group_name,
-                group.start_address,
-                group.count,
+                name,
+                start_address,
+                count,
             )
             return None
 
-        # Extract per-register raw word slices from the group response
-        _extract_register_values(group, response.registers, result)
+        # Slice per-register raw words out of the group response
+        words = response.registers
+        for reg_name, lo, hi in slices:
+            result[reg_name] = words[lo:hi]
 
     return result
-
-
-def _extract_register_values(
-    group: RegisterGroup,
-    raw_words: list[int],
-    out: dict[str, list[int]],
-) -> None:
-    """Slice group-level raw words into per-register word lists.
-
-    Each register's words are determined by its address offset within the
-    group and its ``word_count``.
-
-    Args:
-        group: The register group definition.
-        raw_words: Full list of 16-bit words returned for the group read.
-        out: Output dict to populate with ``{name: [word, ...]}``.
-    """
-    for reg in group.registers:
-        offset = reg.address - group.start_address
-        out[reg.name] = raw_words[offset : offset + reg.word_count]
@@ -7,7 +7,8 @@ Modbus TCP dongle (port 502, slave ID 1, function code 0x04 input registers).
 
 Registers are organised into contiguous groups for efficient batched reads.
 Each group covers a contiguous Modbus address range so the poller can issue
-one ``read_input_registers`` call per group.
+one ``read_input_registers`` call per group.  Groups flagged ``optional``
+may be missing on some firmwares; a Modbus error on them is tolerated.
 
 References:
     - Sungrow Hybrid Inverter Communication Protocol
@@ -15,6 +16,8 @@ References:
     - https://github.com/bohdan-s/SunGather
 
 CHANGELOG:
+- 2026-10-16: Drop POLL_GROUPS coalescing; gap registers are unverified on-device
+- 2026-10-16: Add RegisterGroup.optional and coalesced POLL_GROUPS for polling
 - 2026-02-18: Revert register addresses to original 13008-13027 — addresses 13119-13150
   (GoSungrow p-codes) are cloud API parameter IDs, not Modbus register addresses.
   WiNet-S returns Modbus error for 13119+ range. Original addresses read successfully.
@@ -95,12 +98,15 @@ class RegisterGroup:
         start_address: First Modbus register address in the batch.
         count: Total number of 16-bit words to read.
         registers: Ordered list of :class:`RegisterDef` within this range.
+        optional: If True, a Modbus error on this group is tolerated and
+            the poll continues without its registers.
     """
 
     group_name: str
     start_address: int
     count: int
     registers: list[RegisterDef]
+    optional: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -238,6 +244,9 @@ EXPORT_GROUP = RegisterGroup(
     start_address=5083,
     count=2,  # S32 = 2 words
     registers=_EXPORT_REGISTERS,
+    # Not exposed by every inverter firmware; normalizer falls back to
+    # -grid_power when it is missing.
+    optional=True,
 )
 
 # ---------------------------------------------------------------------------
@@ -355,6 +364,7 @@ ALL_GROUPS: list[RegisterGroup] = [
 ]
 """All register groups in recommended read order."""
 
+
 ALL_REGISTERS: dict[str, RegisterDef] = {
     reg.name: reg for group in ALL_GROUPS for reg in group.registers
 }
@@ -6,16 +6,38 @@ to the spool before any upload attempt. They are only deleted after server
 acknowledgment. The spool survives process restarts because it is backed by
 a SQLite database file on disk in WAL mode.
 
+Each connection is tuned for the append-heavy workload with the PRAGMAs in
+``_CONNECTION_PRAGMAS``.  With WAL, ``synchronous=NORMAL`` skips the fsync on
+every commit and only syncs at checkpoints: committed rows survive a process
+crash, while an OS crash or power loss can roll back the last few commits.
+SQLite's automatic checkpoint (every 1000 WAL pages) stays in charge of
+moving pages into the database; ``journal_size_limit`` bounds the WAL file
+it leaves behind.
+
 Operations:
 - enqueue(payload): INSERT a JSON payload row.
+- enqueue_many(payloads): INSERT several payload rows in one transaction.
 - peek(n): SELECT up to n oldest rows with their rowids (FIFO).
 - ack(rowids): DELETE only the specified rows (confirmed by server).
-- count(): SELECT COUNT(*) of pending samples.
+- count(): Number of pending samples (kept in memory, seeded on open).
 - close(): Close the underlying database connection.
 
 Supports async context manager protocol for clean resource management.
 
 CHANGELOG:
+- 2026-10-16: Roll back a failed enqueue_many() batch
+- 2026-10-16: Cache the ack() IN statement per rowid count
+- 2026-10-16: Drop bucketed/padded ack() statements; non-contiguous acks use plain IN
+- 2026-10-16: Cap page cache and mmap at 8 MiB for the edge RSS budget
+- 2026-10-16: open() applies PRAGMAs and schema in one executescript()
+- 2026-10-16: Cap the WAL file size with journal_size_limit
+- 2026-10-16: ack() deletes contiguous rowid sets with one range predicate
+- 2026-10-16: peek() returns fetchall() rows without copying
+- 2026-10-16: count() returns an in-memory counter seeded on open()
+- 2026-10-16: Reuse bucketed ack() DELETE statements
+- 2026-10-16: Drop AUTOINCREMENT from the rowid column
+- 2026-10-16: Apply WAL/synchronous/cache/mmap/busy_timeout PRAGMAs on open
+- 2026-10-16: Add enqueue_many() for single-transaction batch inserts
 - 2026-02-14: Initial creation (STORY-005)
 
 TODO:
@@ -24,18 +46,41 @@ TODO:
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import aiosqlite
 
+_CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    # Page cache and mmap are capped at 8 MiB each to stay inside the
+    # <50MB RSS budget for the edge daemon (Architecture.md).
+    "PRAGMA mmap_size=8388608;",
+    "PRAGMA cache_size=-8192;",
+    "PRAGMA busy_timeout=3000;",
+    # Truncate the -wal file back to 8 MiB after each auto-checkpoint so a
+    # long outage burst does not leave it permanently grown on /data.
+    "PRAGMA journal_size_limit=8388608;",
+)
+"""Connection PRAGMAs applied in order by Spool.open()."""
+
+# Plain INTEGER PRIMARY KEY: new rows get max(rowid) + 1, which is
+# monotonic while any row is pending, so FIFO order and in-flight ack ids
+# stay valid without AUTOINCREMENT's sqlite_sequence update per insert.
+# Ids may restart only once the spool is empty.
 _CREATE_TABLE_SQL = """\
 CREATE TABLE IF NOT EXISTS spool (
-    rowid INTEGER PRIMARY KEY AUTOINCREMENT,
+    rowid INTEGER PRIMARY KEY,
     payload TEXT NOT NULL,
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 """
 
+_INIT_SCRIPT = "\n".join(_CONNECTION_PRAGMAS) + "\n" + _CREATE_TABLE_SQL
+"""PRAGMAs (WAL first: it is persistent and the others assume it) + schema."""
+
 _INSERT_SQL = """\
 INSERT INTO spool (payload) VALUES (?);
 """
@@ -49,6 +94,21 @@ LIMIT ?;
 
 _COUNT_SQL = "SELECT COUNT(*) FROM spool;"
 
+_ACK_RANGE_SQL = "DELETE FROM spool WHERE rowid BETWEEN ? AND ?;"
+
+
+@functools.cache
+def _ack_in_sql(n: int) -> str:
+    """Return the ``DELETE ... IN`` statement for *n* rowid placeholders.
+
+    Uses parameterized placeholders to prevent SQL injection (SKILL.md).
+    Cached per length so the same SQL text, and sqlite3's prepared
+    statement for it, is reused; lengths are bounded by the upload batch
+    size.
+    """
+    placeholders = ",".join("?" * n)
+    return f"DELETE FROM spool WHERE rowid IN ({placeholders});"  # noqa: S608
+
 
 class Spool:
     """Durable local async FIFO queue backed by a SQLite database.
@@ -76,18 +136,22 @@ class Spool:
     def __init__(self, path: str | Path) -> None:
         self._path = Path(path)
         self._db: aiosqlite.Connection | None = None
+        self._count = 0
 
     async def open(self) -> None:
         """Open the SQLite connection and initialize the schema.
 
         Sets WAL journal mode for concurrent read/write safety and
-        crash durability. Creates the spool table if it does not exist.
+        crash durability, plus the remaining ``_CONNECTION_PRAGMAS``.
+        Creates the spool table if it does not exist and seeds the pending
+        counter with the rows left over from a previous run.
         """
         self._db = await aiosqlite.connect(str(self._path))
-        # Enable WAL mode for concurrent read/write (HC-001 durability).
-        await self._db.execute("PRAGMA journal_mode=WAL;")
-        await self._db.execute(_CREATE_TABLE_SQL)
-        await self._db.commit()
+        # One worker-thread round trip; executescript() commits the DDL.
+        await self._db.executescript(_INIT_SCRIPT)
+        cursor = await self._db.execute(_COUNT_SQL)
+        row = await cursor.fetchone()
+        self._count = row[0]
 
     async def close(self) -> None:
         """Close the underlying SQLite connection.
@@ -129,6 +193,30 @@ class Spool:
         assert self._db is not None, "Spool not opened. Call open() or use async with."
         await self._db.execute(_INSERT_SQL, (payload,))
         await self._db.commit()
+        self._count += 1
+
+    async def enqueue_many(self, payloads: list[str]) -> None:
+        """Insert several JSON payloads in a single transaction.
+
+        Rows are inserted in list order, so FIFO order is preserved. One
+        commit covers the whole batch instead of one per payload. An empty
+        list is a no-op.  If the insert or commit fails the transaction is
+        rolled back, so no partial batch is left for a later commit to
+        persist and the caller can retry the whole batch (HC-001).
+
+        Args:
+            payloads: JSON strings to store, oldest first.
+        """
+        assert self._db is not None, "Spool not opened. Call open() or use async with."
+        if not payloads:
+            return
+        try:
+            await self._db.executemany(_INSERT_SQL, [(p,) for p in payloads])
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+        self._count += len(payloads)
 
     async def peek(self, n: int) -> list[tuple[int, str]]:
         """Return up to *n* oldest pending payloads without removing them.
@@ -148,8 +236,9 @@ class Spool:
         if n < 1:
             return []
         cursor = await self._db.execute(_PEEK_SQL, (n,))
-        rows = await cursor.fetchall()
-        return [(row[0], row[1]) for row in rows]
+        # No row_factory is set, so fetchall() already yields a list of
+        # plain (rowid, payload) tuples.
+        return await cursor.fetchall()  # type: ignore[return-value]
 
     async def ack(self, rowids: list[int]) -> None:
         """Delete confirmed rows from the spool.
@@ -158,6 +247,10 @@ class Spool:
         Nonexistent rowids are silently ignored. An empty list is a no-op.
 
         Uses parameterized placeholders to prevent SQL injection (AC6).
+        A FIFO batch from :meth:`peek` is normally a contiguous run of
+        rowids, which is deleted with a single ``BETWEEN`` range; any
+        other list falls back to ``rowid IN (...)``, whose SQL is cached
+        per list length by :func:`_ack_in_sql`.
 
         Args:
             rowids: List of rowid integers to delete.
@@ -165,19 +258,24 @@ class Spool:
         assert self._db is not None, "Spool not opened. Call open() or use async with."
         if not rowids:
             return
-        # Use parameterized placeholders to prevent SQL injection (SKILL.md).
-        placeholders = ",".join("?" for _ in rowids)
-        sql = f"DELETE FROM spool WHERE rowid IN ({placeholders});"  # noqa: S608
-        await self._db.execute(sql, rowids)
+        lo, hi = min(rowids), max(rowids)
+        if hi - lo == len(rowids) - 1 and len(set(rowids)) == len(rowids):
+            # Distinct ids spanning exactly len(rowids) values: the whole range.
+            cursor = await self._db.execute(_ACK_RANGE_SQL, (lo, hi))
+        else:
+            cursor = await self._db.execute(_ack_in_sql(len(rowids)), rowids)
         await self._db.commit()
+        self._count -= cursor.rowcount
 
     async def count(self) -> int:
         """Return the number of pending (unacknowledged) payloads.
 
+        The count is tracked in memory: seeded by one ``COUNT(*)`` in
+        :meth:`open`, then adjusted after each committed enqueue and ack,
+        so this does not scan the table however large the backlog grows.
+
         Returns:
             Integer count of rows in the spool table.
         """
         assert self._db is not None, "Spool not opened. Call open() or use async with."
-        cursor = await self._db.execute(_COUNT_SQL)
-        row = await cursor.fetchone()
-        return row[0]
+        return self._count
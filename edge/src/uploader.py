@@ -12,6 +12,7 @@ Operations:
 - current_backoff: Current backoff delay in seconds (read-only property).
 
 CHANGELOG:
+- 2026-10-16: Splice spooled JSON payloads into the POST body verbatim
 - 2026-02-14: Initial creation (STORY-006)
 
 TODO:
@@ -20,7 +21,6 @@ TODO:
 
 from __future__ import annotations
 
-import json
 import logging
 
 import httpx
@@ -30,6 +30,18 @@ logger = logging.getLogger(__name__)
 _INITIAL_BACKOFF_S = 1.0
 _DEFAULT_MAX_BACKOFF_S = 300.0
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _ingest_body(payloads: list[str]) -> str:
+    """Build the ``{"samples": [...]}`` ingest body from spooled payloads.
+
+    Each payload is already a serialized JSON object (written by the poll
+    loop), so it is spliced in verbatim instead of being parsed and
+    re-encoded.
+    """
+    return '{"samples":[' + ",".join(payloads) + "]}"
+
 
 class Uploader:
     """HTTPS batch uploader for the VPS ingest endpoint.
@@ -119,14 +131,17 @@ class Uploader:
             return False
 
         rowids = [rowid for rowid, _ in rows]
-        samples = [json.loads(payload) for _, payload in rows]
+        body = _ingest_body([payload for _, payload in rows])
 
         try:
             async with httpx.AsyncClient(verify=True) as client:
                 response = await client.post(
                     f"{self._vps_base_url}/v1/ingest",
-                    json={"samples": samples},
-                    headers={"Authorization": f"Bearer {self._vps_device_token}"},
+                    content=body,
+                    headers={
+                        **_JSON_HEADERS,
+                        "Authorization": f"Bearer {self._vps_device_token}",
+                    },
                 )
         except (httpx.ConnectError, httpx.TimeoutException) as exc:
             logger.warning("Upload failed (network error): %s", exc)
@@ -135,7 +150,7 @@ class Uploader:
 
         if response.status_code == 200:
             await spool.ack(rowids)  # type: ignore[union-attr]
-            logger.info("Uploaded %d samples, acked rowids %s.", len(samples), rowids)
+            logger.info("Uploaded %d samples, acked rowids %s.", len(rows), rowids)
             self._reset_backoff()
             return True
 
@@ -0,0 +1,55 @@
+"""
+Unit tests for the cached ISO timestamp helpers.
+
+Tests verify:
+- iso_utc() matches datetime.fromtimestamp(t, tz=UTC).isoformat().
+- Whole-second timestamps omit the microsecond suffix, like isoformat().
+- iso_now() returns a parseable, timezone-aware timestamp.
+
+CHANGELOG:
+- 2026-10-16: Initial creation
+
+TODO:
+- None
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from edge.src.clock import iso_now, iso_utc
+
+
+class TestIsoUtc:
+    """iso_utc() is a drop-in replacement for isoformat()."""
+
+    @pytest.mark.parametrize(
+        "t",
+        [
+            1_771_000_000.0,
+            1_771_000_000.5,
+            1_771_000_000.000001,
+            1_771_000_000.9999999,
+            1_771_000_059.123456,
+        ],
+    )
+    def test_matches_datetime_isoformat(self, t: float) -> None:
+        assert iso_utc(t) == datetime.fromtimestamp(t, tz=UTC).isoformat()
+
+    def test_whole_second_has_no_fraction(self) -> None:
+        assert iso_utc(1_771_000_000.0).endswith(":40+00:00")
+
+    def test_consecutive_seconds_refresh_prefix(self) -> None:
+        first = iso_utc(1_771_000_000.2)
+        second = iso_utc(1_771_000_001.2)
+        assert first[:19] != second[:19]
+
+
+class TestIsoNow:
+    """iso_now() formats the current wall-clock time."""
+
+    def test_iso_now_is_parseable_utc(self) -> None:
+        parsed = datetime.fromisoformat(iso_now())
+        assert parsed.tzinfo is not None
+        assert parsed.utcoffset().total_seconds() == 0
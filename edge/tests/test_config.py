@@ -7,8 +7,12 @@ Tests verify:
 - VPS_BASE_URL is validated as HTTPS (HC-003).
 - Numeric constraints are enforced (poll_interval, batch_size, port, slave_id).
 - DEVICE_ID defaults to SUNGROW_HOST when not set.
+- Spool enqueue batching settings default to write-through, reject
+  non-positive values, and accept a fractional flush interval.
 
 CHANGELOG:
+- 2026-10-16: Add fractional enqueue flush interval test
+- 2026-10-16: Add enqueue batching settings tests
 - 2026-02-14: Initial creation (STORY-001)
 
 TODO:
@@ -290,3 +294,60 @@ class TestNumericConstraints:
         assert settings.batch_size == 100
         assert settings.upload_interval_s == 30
         assert settings.sungrow_port == 1502
+
+
+# ---------------------------------------------------------------------------
+# Spool enqueue batching
+# ---------------------------------------------------------------------------
+
+
+class TestEnqueueBatchingConfig:
+    """ENQUEUE_BATCH_SIZE / ENQUEUE_FLUSH_INTERVAL_S defaults and limits."""
+
+    def test_enqueue_batching_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Batching is disabled by default (every sample written through)."""
+        monkeypatch.setenv("SUNGROW_HOST", "192.168.1.1")
+        monkeypatch.setenv("VPS_BASE_URL", "https://example.com")
+        monkeypatch.setenv("VPS_DEVICE_TOKEN", "device-token")
+
+        settings = EdgeSettings()
+        assert settings.enqueue_batch_size == 1
+        assert settings.enqueue_flush_interval_s == 60
+
+    def test_enqueue_batch_size_zero_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ENQUEUE_BATCH_SIZE below 1 is rejected."""
+        monkeypatch.setenv("SUNGROW_HOST", "192.168.1.1")
+        monkeypatch.setenv("VPS_BASE_URL", "https://example.com")
+        monkeypatch.setenv("VPS_DEVICE_TOKEN", "device-token")
+        monkeypatch.setenv("ENQUEUE_BATCH_SIZE", "0")
+
+        with pytest.raises(ValidationError) as exc_info:
+            EdgeSettings()
+        assert "enqueue_batch_size" in str(exc_info.value).lower()
+
+    def test_enqueue_flush_interval_zero_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ENQUEUE_FLUSH_INTERVAL_S of zero is rejected."""
+        monkeypatch.setenv("SUNGROW_HOST", "192.168.1.1")
+        monkeypatch.setenv("VPS_BASE_URL", "https://example.com")
+        monkeypatch.setenv("VPS_DEVICE_TOKEN", "device-token")
+        monkeypatch.setenv("ENQUEUE_FLUSH_INTERVAL_S", "0")
+
+        with pytest.raises(ValidationError) as exc_info:
+            EdgeSettings()
+        assert "enqueue_flush_interval_s" in str(exc_info.value).lower()
+
+    def test_enqueue_flush_interval_accepts_fraction(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ENQUEUE_FLUSH_INTERVAL_S is parsed as float seconds."""
+        monkeypatch.setenv("SUNGROW_HOST", "192.168.1.1")
+        monkeypatch.setenv("VPS_BASE_URL", "https://example.com")
+        monkeypatch.setenv("VPS_DEVICE_TOKEN", "device-token")
+        monkeypatch.setenv("ENQUEUE_FLUSH_INTERVAL_S", "2.5")
+
+        settings = EdgeSettings()
+        assert settings.enqueue_flush_interval_s == 2.5
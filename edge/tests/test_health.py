@@ -7,8 +7,13 @@ Tests verify:
 - HealthWriter.set_spool_count() updates spool_count.
 - Health file always contains all three fields (last_poll_ts, last_upload_ts,
   spool_count).
+- Health file is published atomically and unchanged state is not rewritten.
+- HealthWriter.run() defers and coalesces writes while active.
 
 CHANGELOG:
+- 2026-10-16: Add record_poll(ts) test
+- 2026-10-16: Add run() flush coroutine tests
+- 2026-10-16: Add atomic publish and skip-unchanged tests
 - 2026-02-14: Initial creation (STORY-015)
 
 TODO:
@@ -17,9 +22,12 @@ TODO:
 
 from __future__ import annotations
 
+import asyncio
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
 from edge.src.health import HealthWriter
 
 # ---------------------------------------------------------------------------
@@ -61,6 +69,17 @@ class TestRecordPollWritesHealthFile:
         assert ts1 is not None
         assert ts2 is not None
 
+    def test_record_poll_uses_given_timestamp(self, tmp_path: Path) -> None:
+        """record_poll(ts) stores the caller's timestamp verbatim."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+        ts = datetime(2026, 2, 14, 10, 0, 0, 123456, tzinfo=UTC)
+
+        writer.record_poll(ts)
+
+        data = json.loads(health_path.read_text())
+        assert data["last_poll_ts"] == "2026-02-14T10:00:00.123456+00:00"
+
 
 # ---------------------------------------------------------------------------
 # Test: record_upload updates last_upload_ts
@@ -192,3 +211,106 @@ class TestHealthFileContainsAllFields:
 
         data = json.loads(Path(health_path).read_text())
         assert data["last_poll_ts"] is not None
+
+
+# ---------------------------------------------------------------------------
+# Test: atomic publish and skip-unchanged writes
+# ---------------------------------------------------------------------------
+
+
+class TestAtomicWrite:
+    """Health file is published via temp file + rename, only on change."""
+
+    def test_no_temp_file_left_behind(self, tmp_path: Path) -> None:
+        """After a write, only the published health file remains."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+
+        writer.set_spool_count(3)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["health.json"]
+
+    def test_unchanged_state_is_not_rewritten(self, tmp_path: Path) -> None:
+        """Re-writing identical state leaves the published file untouched."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+
+        writer.set_spool_count(3)
+        inode_before = health_path.stat().st_ino
+        writer.set_spool_count(3)
+
+        assert health_path.stat().st_ino == inode_before
+
+    def test_changed_state_is_rewritten(self, tmp_path: Path) -> None:
+        """A state change publishes a new file."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path, fsync=True)
+
+        writer.set_spool_count(3)
+        writer.set_spool_count(4)
+
+        data = json.loads(health_path.read_text())
+        assert data["spool_count"] == 4
+
+
+# ---------------------------------------------------------------------------
+# Test: run() flush coroutine defers and coalesces writes
+# ---------------------------------------------------------------------------
+
+
+class TestFlushCoroutine:
+    """While run() is active, mutators defer writes to the coroutine."""
+
+    @pytest.mark.asyncio
+    async def test_mutators_do_not_write_while_running(self, tmp_path: Path) -> None:
+        """Mutators only touch memory; the coroutine publishes the state."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+        shutdown_event = asyncio.Event()
+
+        task = asyncio.create_task(writer.run(shutdown_event, min_interval_s=0.05))
+        await asyncio.sleep(0)
+
+        writer.set_spool_count(5)
+        writer.record_poll()
+        assert not health_path.exists()
+
+        await asyncio.sleep(0.02)
+        data = json.loads(health_path.read_text())
+        assert data["spool_count"] == 5
+        assert data["last_poll_ts"] is not None
+
+        shutdown_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_pending_state_flushed_on_shutdown(self, tmp_path: Path) -> None:
+        """State changed just before shutdown is still written."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+        shutdown_event = asyncio.Event()
+
+        task = asyncio.create_task(writer.run(shutdown_event, min_interval_s=10.0))
+        await asyncio.sleep(0)
+        writer.set_spool_count(1)
+        await asyncio.sleep(0)
+        writer.set_spool_count(9)
+        shutdown_event.set()
+        await asyncio.wait_for(task, timeout=15.0)
+
+        data = json.loads(health_path.read_text())
+        assert data["spool_count"] == 9
+
+    @pytest.mark.asyncio
+    async def test_writes_are_immediate_after_run_exits(self, tmp_path: Path) -> None:
+        """After run() returns, mutators write synchronously again."""
+        health_path = tmp_path / "health.json"
+        writer = HealthWriter(health_path)
+        shutdown_event = asyncio.Event()
+        shutdown_event.set()
+
+        await writer.run(shutdown_event, min_interval_s=0.01)
+        writer.set_spool_count(2)
+
+        data = json.loads(health_path.read_text())
+        assert data["spool_count"] == 2
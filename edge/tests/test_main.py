@@ -12,8 +12,26 @@ Tests verify:
 - Poll error doesn't crash the loop.
 - Upload error doesn't crash the loop.
 - Startup logs config summary without secrets (AC5).
+- JSON log formatter output matches json.dumps of the entry dict.
+- Opt-in enqueue batching flushes on size, on age (even after a failed
+  poll), and on shutdown; health counts buffered samples.
+- Raw debug snapshots include only known registers present in the poll.
+- Raw debug snapshots are logged once every N polls.
 
 CHANGELOG:
+- 2026-10-16: Drive single poll cycles through _read_poll/_store_poll
+- 2026-10-16: Add aged-batch flush and buffered health count tests
+- 2026-10-16: Add shutdown logging test
+- 2026-10-16: Assert health last_poll_ts matches the sample timestamp
+- 2026-10-16: Add filtered raw snapshot test
+- 2026-10-16: Assert poll success log message text
+- 2026-10-16: Add raw debug snapshot cadence test
+- 2026-10-16: Add raw debug snapshot tests
+- 2026-10-16: Assert enqueued payload matches model_dump_json()
+- 2026-10-16: Add enqueue batching tests
+- 2026-10-16: Add poll/store overlap tests
+- 2026-10-16: Add prompt-shutdown test for long loop intervals
+- 2026-10-16: Add JSON log formatter equivalence test
 - 2026-02-14: Initial creation -- TDD tests written first (STORY-014)
 
 TODO:
@@ -25,6 +43,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -112,14 +131,14 @@ class TestPollLoopHappyPath:
     @pytest.mark.asyncio
     async def test_poll_loop_calls_full_pipeline(self) -> None:
         """Poll loop calls poller.poll(), normalize(), spool.enqueue()."""
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         sample = _make_sample()
 
         with patch("edge.src.main.normalize", return_value=sample) as mock_normalize:
-            await _poll_once(
-                poller=components["poller"],
+            await _store_poll(
+                await _read_poll(components["poller"]),
                 spool=components["spool"],
                 device_id="sungrow-test",
                 health=None,
@@ -139,6 +158,46 @@ class TestPollLoopHappyPath:
         assert parsed["device_id"] == "sungrow-test"
         assert parsed["pv_power_w"] == 3500.0
 
+    @pytest.mark.asyncio
+    async def test_enqueued_payload_matches_model_dump_json(self) -> None:
+        """The pre-bound serializer yields exactly model_dump_json() text."""
+        from edge.src.main import _read_poll, _store_poll
+
+        components = _make_components()
+        sample = _make_sample()
+
+        with patch("edge.src.main.normalize", return_value=sample):
+            await _store_poll(
+                await _read_poll(components["poller"]),
+                spool=components["spool"],
+                device_id="sungrow-test",
+                health=None,
+            )
+
+        components["spool"].enqueue.assert_awaited_once_with(sample.model_dump_json())
+
+    @pytest.mark.asyncio
+    async def test_poll_success_logs_device_id(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A successful poll logs the preformatted per-device message."""
+        from edge.src.main import _read_poll, _store_poll
+
+        components = _make_components()
+
+        with (
+            patch("edge.src.main.normalize", return_value=_make_sample()),
+            caplog.at_level(logging.INFO, logger="edge.src.main"),
+        ):
+            await _store_poll(
+                await _read_poll(components["poller"]),
+                spool=components["spool"],
+                device_id="sungrow-test",
+                health=None,
+            )
+
+        assert "Poll success: enqueued sample for device=sungrow-test" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # Test: normalizer returning None skips spool.enqueue() (AC7)
@@ -151,13 +210,13 @@ class TestNormalizerNoneSkipsEnqueue:
     @pytest.mark.asyncio
     async def test_normalizer_none_skips_enqueue(self) -> None:
         """When normalize() returns None, spool.enqueue() is NOT called."""
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
 
         with patch("edge.src.main.normalize", return_value=None):
-            await _poll_once(
-                poller=components["poller"],
+            await _store_poll(
+                await _read_poll(components["poller"]),
                 spool=components["spool"],
                 device_id="sungrow-test",
                 health=None,
@@ -178,14 +237,14 @@ class TestPollerNoneSkipsNormalizerAndSpool:
     @pytest.mark.asyncio
     async def test_poller_none_skips_everything(self) -> None:
         """Poller returning None skips normalize() and spool.enqueue()."""
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         components["poller"].poll = AsyncMock(return_value=None)
 
         with patch("edge.src.main.normalize") as mock_normalize:
-            await _poll_once(
-                poller=components["poller"],
+            await _store_poll(
+                await _read_poll(components["poller"]),
                 spool=components["spool"],
                 device_id="sungrow-test",
                 health=None,
@@ -295,6 +354,32 @@ class TestGracefulShutdown:
             # Should complete within a reasonable time
             await asyncio.wait_for(asyncio.gather(task, trigger), timeout=5.0)
 
+    @pytest.mark.asyncio
+    async def test_shutdown_is_logged_once(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """run_loops logs the shutdown once, however often the event is set."""
+        from edge.src.main import run_loops
+
+        components = _make_components()
+        shutdown_event = asyncio.Event()
+        shutdown_event.set()
+        shutdown_event.set()
+
+        with caplog.at_level(logging.INFO, logger="edge.src.main"):
+            await run_loops(
+                poller=components["poller"],
+                spool=components["spool"],
+                uploader=components["uploader"],
+                device_id="sungrow-test",
+                poll_interval_s=60,
+                upload_interval_s=60,
+                shutdown_event=shutdown_event,
+                health=None,
+            )
+
+        assert caplog.messages.count("Shutdown requested, loops stopped") == 1
+
     @pytest.mark.asyncio
     async def test_shutdown_attempts_final_upload(self) -> None:
         """On shutdown, a final upload flush is attempted."""
@@ -331,6 +416,42 @@ class TestGracefulShutdown:
         assert components["uploader"].upload_batch.await_count >= 1
 
 
+class TestShutdownWakesSleepingLoops:
+    """Shutdown interrupts the interval sleep instead of waiting it out."""
+
+    @pytest.mark.asyncio
+    async def test_long_interval_loops_exit_promptly(self) -> None:
+        """Loops sleeping on a 60 s interval exit as soon as shutdown is set."""
+        from edge.src.main import _poll_loop, _upload_loop
+
+        components = _make_components()
+        shutdown_event = asyncio.Event()
+
+        with patch("edge.src.main.normalize", return_value=_make_sample()):
+            loops = asyncio.gather(
+                _poll_loop(
+                    poller=components["poller"],
+                    spool=components["spool"],
+                    device_id="sungrow-test",
+                    poll_interval_s=60,
+                    shutdown_event=shutdown_event,
+                    health=None,
+                ),
+                _upload_loop(
+                    uploader=components["uploader"],
+                    spool=components["spool"],
+                    upload_interval_s=60,
+                    shutdown_event=shutdown_event,
+                ),
+            )
+            await asyncio.sleep(0.05)
+            shutdown_event.set()
+            await asyncio.wait_for(loops, timeout=1.0)
+
+        components["poller"].poll.assert_awaited_once()
+        components["uploader"].upload_batch.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # Test: health file updated after poll (AC6)
 # ---------------------------------------------------------------------------
@@ -343,7 +464,7 @@ class TestHealthFileUpdate:
     async def test_health_file_written_after_poll(self, tmp_path: Path) -> None:
         """Health file is written with JSON after a successful poll."""
         from edge.src.health import HealthWriter
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         components["spool"].count = AsyncMock(return_value=5)
@@ -352,8 +473,8 @@ class TestHealthFileUpdate:
         health = HealthWriter(health_path)
 
         with patch("edge.src.main.normalize", return_value=sample):
-            await _poll_once(
-                poller=components["poller"],
+            await _store_poll(
+                await _read_poll(components["poller"]),
                 spool=components["spool"],
                 device_id="sungrow-test",
                 health=health,
@@ -364,13 +485,37 @@ class TestHealthFileUpdate:
         assert "last_poll_ts" in health_data
         assert health_data["spool_count"] == 5
 
+    @pytest.mark.asyncio
+    async def test_health_poll_ts_matches_sample_ts(self, tmp_path: Path) -> None:
+        """The health file reuses the timestamp the sample was stamped with."""
+        from edge.src.health import HealthWriter
+        from edge.src.main import _read_poll, _store_poll
+
+        components = _make_components()
+        health_path = tmp_path / "health.json"
+        health = HealthWriter(health_path)
+
+        with patch(
+            "edge.src.main.normalize", return_value=_make_sample()
+        ) as mock_normalize:
+            await _store_poll(
+                await _read_poll(components["poller"]),
+                spool=components["spool"],
+                device_id="sungrow-test",
+                health=health,
+            )
+
+        sample_ts = mock_normalize.call_args.kwargs["ts"]
+        health_data = json.loads(health_path.read_text())
+        assert health_data["last_poll_ts"] == sample_ts.isoformat()
+
     @pytest.mark.asyncio
     async def test_health_file_updated_even_on_poll_failure(
         self, tmp_path: Path
     ) -> None:
         """Health file is updated even when poller returns None."""
         from edge.src.health import HealthWriter
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         components["poller"].poll = AsyncMock(return_value=None)
@@ -378,8 +523,8 @@ class TestHealthFileUpdate:
         health_path = tmp_path / "health.json"
         health = HealthWriter(health_path)
 
-        await _poll_once(
-            poller=components["poller"],
+        await _store_poll(
+            await _read_poll(components["poller"]),
             spool=components["spool"],
             device_id="sungrow-test",
             health=health,
@@ -402,7 +547,7 @@ class TestPollErrorResilience:
     @pytest.mark.asyncio
     async def test_poll_exception_does_not_crash(self) -> None:
         """An exception in poller.poll() is caught, loop continues."""
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         components["poller"].poll = AsyncMock(
@@ -410,8 +555,8 @@ class TestPollErrorResilience:
         )
 
         # Should not raise
-        await _poll_once(
-            poller=components["poller"],
+        await _store_poll(
+            await _read_poll(components["poller"]),
             spool=components["spool"],
             device_id="sungrow-test",
             health=None,
@@ -423,7 +568,7 @@ class TestPollErrorResilience:
     @pytest.mark.asyncio
     async def test_enqueue_exception_does_not_crash(self) -> None:
         """An exception in spool.enqueue() is caught, loop continues."""
-        from edge.src.main import _poll_once
+        from edge.src.main import _read_poll, _store_poll
 
         components = _make_components()
         components["spool"].enqueue = AsyncMock(
@@ -433,8 +578,8 @@ class TestPollErrorResilience:
 
         with patch("edge.src.main.normalize", return_value=sample):
             # Should not raise
-            await _poll_once(
-                poller=components["poller"],
+            await _store_poll(
+                await _read_poll(components["poller"]),
                 spool=components["spool"],
                 device_id="sungrow-test",
                 health=None,
@@ -518,6 +663,68 @@ class TestStartupLogging:
         assert "10" in full_log  # upload_interval_s
 
 
+# ---------------------------------------------------------------------------
+# Test: structured JSON log formatter
+# ---------------------------------------------------------------------------
+
+
+def _build_json_formatter() -> logging.Formatter:
+    """Return the formatter configure_logging() installs, restoring root."""
+    from edge.src.main import configure_logging
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        configure_logging()
+        return root.handlers[0].formatter
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+class TestJsonLogFormatter:
+    """Structured log lines are identical to json.dumps of the entry dict."""
+
+    def test_formatter_matches_json_dumps(self) -> None:
+        """Cached-fragment output equals json.dumps, including escaping."""
+        formatter = _build_json_formatter()
+
+        for _ in range(2):  # second pass hits the fragment cache
+            record = logging.LogRecord(
+                "edge.src.main",
+                logging.WARNING,
+                __file__,
+                1,
+                'quote " and \u00e9 %s',
+                ("arg",),
+                None,
+            )
+            expected = json.dumps(
+                {
+                    "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+                    "level": "WARNING",
+                    "logger": "edge.src.main",
+                    "msg": record.getMessage(),
+                }
+            )
+            assert formatter.format(record) == expected
+
+    def test_formatter_includes_exception(self) -> None:
+        """Records with exc_info carry an 'exception' field."""
+        formatter = _build_json_formatter()
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord(
+            "edge.src.main", logging.ERROR, __file__, 1, "failed", (), exc_info
+        )
+
+        parsed = json.loads(formatter.format(record))
+        assert "RuntimeError: boom" in parsed["exception"]
+
+
 # ---------------------------------------------------------------------------
 # Test: full integration of poll loop with multiple iterations
 # ---------------------------------------------------------------------------
@@ -561,6 +768,291 @@ class TestPollLoopMultipleIterations:
         assert call_count >= 3
 
 
+class TestPollLoopOverlapsStore:
+    """Spool/health work of one poll overlaps with the next poll."""
+
+    @pytest.mark.asyncio
+    async def test_next_poll_does_not_wait_for_enqueue(self) -> None:
+        """The second poll starts while the first enqueue is still running."""
+        from edge.src.main import _poll_loop
+
+        components = _make_components()
+        shutdown_event = asyncio.Event()
+        second_poll_started = asyncio.Event()
+        poll_count = 0
+
+        async def counting_poll() -> dict[str, list[int]]:
+            nonlocal poll_count
+            poll_count += 1
+            if poll_count == 2:
+                second_poll_started.set()
+            if poll_count >= 3:
+                shutdown_event.set()
+            return _FAKE_RAW
+
+        async def blocking_enqueue(payload: str) -> None:
+            # Would deadlock if the loop awaited enqueue before polling again.
+            await second_poll_started.wait()
+
+        components["poller"].poll = AsyncMock(side_effect=counting_poll)
+        components["spool"].enqueue = AsyncMock(side_effect=blocking_enqueue)
+
+        with patch("edge.src.main.normalize", return_value=_make_sample()):
+            await asyncio.wait_for(
+                _poll_loop(
+                    poller=components["poller"],
+                    spool=components["spool"],
+                    device_id="sungrow-test",
+                    poll_interval_s=0.01,
+                    shutdown_event=shutdown_event,
+                    health=None,
+                ),
+                timeout=5.0,
+            )
+
+        assert poll_count >= 3
+
+    @pytest.mark.asyncio
+    async def test_pending_store_completes_before_loop_returns(self) -> None:
+        """The last poll's enqueue is finished before _poll_loop returns."""
+        from edge.src.main import _poll_loop
+
+        components = _make_components()
+        shutdown_event = asyncio.Event()
+
+        async def poll_then_shutdown() -> dict[str, list[int]]:
+            shutdown_event.set()
+            return _FAKE_RAW
+
+        async def slow_enqueue(payload: str) -> None:
+            await asyncio.sleep(0.05)
+
+        components["poller"].poll = AsyncMock(side_effect=poll_then_shutdown)
+        components["spool"].enqueue = AsyncMock(side_effect=slow_enqueue)
+
+        with patch("edge.src.main.normalize", return_value=_make_sample()):
+            await _poll_loop(
+                poller=components["poller"],
+                spool=components["spool"],
+                device_id="sungrow-test",
+                poll_interval_s=0.01,
+                shutdown_event=shutdown_event,
+                health=None,
+            )
+
+        components["spool"].enqueue.assert_awaited_once()
+
+
+class TestRawDebugSnapshot:
+    """Raw debug snapshots log the known registers present in the poll."""
+
+    def test_snapshot_includes_only_known_present_registers(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Unknown and absent registers are left out of the snapshot."""
+        from edge.src.main import _log_raw_snapshot
+
+        raw = {"battery_soc": [725], "load_power": [0, 2000], "unrelated": [1]}
+
+        with caplog.at_level(logging.WARNING, logger="edge.src.main"):
+            _log_raw_snapshot(raw)
+
+        assert caplog.records[-1].getMessage() == (
+            "Raw register snapshot: {'battery_soc': [725], 'load_power': [0, 2000]}"
+        )
+
+    def test_snapshot_skipped_when_warning_filtered(self) -> None:
+        """No snapshot dict is built when WARNING records would be dropped."""
+        from edge.src.main import _log_raw_snapshot
+
+        raw = MagicMock()
+        main_logger = logging.getLogger("edge.src.main")
+        previous = main_logger.level
+        main_logger.setLevel(logging.ERROR)
+        try:
+            _log_raw_snapshot(raw)
+        finally:
+            main_logger.setLevel(previous)
+
+        raw.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_logged_every_n_polls(self) -> None:
+        """With N=3, the snapshot fires on polls 3 and 6 only."""
+        from edge.src.main import _read_poll, _store_poll
+
+        components = _make_components()
+        raw_debug_state = [3]
+
+        with (
+            patch("edge.src.main.normalize", return_value=None),
+            patch("edge.src.main._log_raw_snapshot") as mock_snapshot,
+        ):
+            fired = []
+            for poll in range(1, 8):
+                await _store_poll(
+                    await _read_poll(components["poller"]),
+                    spool=components["spool"],
+                    device_id="sungrow-test",
+                    health=None,
+                    raw_debug_enabled=True,
+                    raw_debug_every_n_polls=3,
+                    raw_debug_state=raw_debug_state,
+                )
+                if mock_snapshot.call_count > len(fired):
+                    fired.append(poll)
+
+        assert fired == [3, 6]
+
+
+class TestEnqueueBatching:
+    """ENQUEUE_BATCH_SIZE > 1 writes samples to the spool in batches."""
+
+    @pytest.mark.asyncio
+    async def test_batcher_flushes_when_full(self) -> None:
+        """A batch is written with one enqueue_many once it is full."""
+        from edge.src.main import _EnqueueBatcher
+
+        spool = AsyncMock()
+        batcher = _EnqueueBatcher(spool, max_pending=3, flush_interval_s=3600)
+
+        await batcher.add("a")
+        await batcher.add("b")
+        spool.enqueue_many.assert_not_awaited()
+
+        await batcher.add("c")
+        spool.enqueue_many.assert_awaited_once_with(["a", "b", "c"])
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_batcher_keeps_payloads_on_failure(self) -> None:
+        """A failed flush keeps the payloads buffered for the next flush."""
+        from edge.src.main import _EnqueueBatcher
+
+        spool = AsyncMock()
+        spool.enqueue_many = AsyncMock(side_effect=[OSError("disk full"), None])
+        batcher = _EnqueueBatcher(spool, max_pending=2, flush_interval_s=3600)
+
+        await batcher.add("a")
+        with pytest.raises(OSError):
+            await batcher.add("b")
+        assert batcher.pending_count == 2
+
+        await batcher.flush()
+        spool.enqueue_many.assert_awaited_with(["a", "b"])
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_flushes_aged_batch(self) -> None:
+        """A failed poll still flushes a batch older than the flush interval."""
+        from edge.src.main import _EnqueueBatcher, _store_poll
+
+        spool = AsyncMock()
+        spool.enqueue_many = AsyncMock()
+        batcher = _EnqueueBatcher(spool, max_pending=10, flush_interval_s=60)
+
+        with patch("edge.src.main.time.monotonic", return_value=1000.0):
+            await batcher.add("a")
+        spool.enqueue_many.assert_not_awaited()
+
+        with patch("edge.src.main.time.monotonic", return_value=1060.0):
+            await _store_poll(
+                None,
+                spool=spool,
+                device_id="sungrow-test",
+                health=None,
+                batcher=batcher,
+            )
+
+        spool.enqueue_many.assert_awaited_once_with(["a"])
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_normalizer_none_flushes_aged_batch(self) -> None:
+        """A poll that normalizes to None still flushes an aged batch."""
+        from edge.src.main import _EnqueueBatcher, _store_poll
+
+        spool = AsyncMock()
+        spool.enqueue_many = AsyncMock()
+        batcher = _EnqueueBatcher(spool, max_pending=10, flush_interval_s=60)
+
+        with patch("edge.src.main.time.monotonic", return_value=1000.0):
+            await batcher.add("a")
+
+        with (
+            patch("edge.src.main.time.monotonic", return_value=1061.0),
+            patch("edge.src.main.normalize", return_value=None),
+        ):
+            await _store_poll(
+                _FAKE_RAW,
+                spool=spool,
+                device_id="sungrow-test",
+                health=None,
+                batcher=batcher,
+            )
+
+        spool.enqueue_many.assert_awaited_once_with(["a"])
+
+    @pytest.mark.asyncio
+    async def test_health_count_includes_buffered_samples(self) -> None:
+        """Health spool_count adds samples still held by the batcher."""
+        from edge.src.main import _EnqueueBatcher, _store_poll
+
+        spool = AsyncMock()
+        spool.count = AsyncMock(return_value=5)
+        spool.enqueue_many = AsyncMock()
+        batcher = _EnqueueBatcher(spool, max_pending=10, flush_interval_s=3600)
+        health = MagicMock()
+
+        await batcher.add("a")
+        with patch("edge.src.main.normalize", return_value=_make_sample()):
+            await _store_poll(
+                _FAKE_RAW,
+                spool=spool,
+                device_id="sungrow-test",
+                health=health,
+                batcher=batcher,
+            )
+
+        spool.enqueue_many.assert_not_awaited()
+        health.set_spool_count.assert_called_once_with(7)
+
+    @pytest.mark.asyncio
+    async def test_poll_loop_flushes_partial_batch_on_shutdown(self) -> None:
+        """Buffered samples are written to the spool when the loop stops."""
+        from edge.src.main import _poll_loop
+
+        components = _make_components()
+        components["spool"].enqueue_many = AsyncMock()
+        shutdown_event = asyncio.Event()
+        poll_count = 0
+
+        async def counting_poll() -> dict[str, list[int]]:
+            nonlocal poll_count
+            poll_count += 1
+            if poll_count >= 2:
+                shutdown_event.set()
+            return _FAKE_RAW
+
+        components["poller"].poll = AsyncMock(side_effect=counting_poll)
+
+        with patch("edge.src.main.normalize", return_value=_make_sample()):
+            await _poll_loop(
+                poller=components["poller"],
+                spool=components["spool"],
+                device_id="sungrow-test",
+                poll_interval_s=0.01,
+                shutdown_event=shutdown_event,
+                health=None,
+                enqueue_batch_size=10,
+            )
+
+        components["spool"].enqueue.assert_not_awaited()
+        components["spool"].enqueue_many.assert_awaited_once()
+        (batch,) = components["spool"].enqueue_many.await_args.args
+        assert len(batch) == 2
+
+
 # ---------------------------------------------------------------------------
 # Test: full integration of upload loop with multiple iterations
 # ---------------------------------------------------------------------------
@@ -5,6 +5,12 @@ Verifies type conversions (U16/U32/S16/S32), scaling, range validation,
 and that the normalizer is a pure function with no side effects.
 
 CHANGELOG:
+- 2026-10-16: Check U32 assembly through an extractor, not _convert_u32
+- 2026-10-16: Match log assertions against the joined messages
+- 2026-10-16: Integration test fills group words from a lookup table
+- 2026-10-16: Unknown mapped register fails plan construction
+- 2026-10-16: Add short word list (shape validation) tests
+- 2026-10-16: Add import-time normalize plan and extractor cache tests
 - 2026-02-14: Initial creation -- TDD tests written first (STORY-004)
 
 TODO:
@@ -167,11 +173,13 @@ class TestU32Assembly:
         Verifies U32 assembly math: (hi << 16) | lo.
         65536 exceeds total_dc_power valid_range (0, 20000) so the full
         normalize() rightly returns None.  We verify the assembly itself
-        via the internal helper.
+        via an unranged U32 extractor.
         """
-        from edge.src.normalizer import _convert_u32
+        from edge.src.normalizer import _make_extractor
+        from edge.src.registers import RegisterDef
 
-        assert _convert_u32(0x0001, 0x0000) == 65536
+        reg = RegisterDef(address=0, name="u32", reg_type="U32", unit="")
+        assert _make_extractor(reg)({"u32": [0x0001, 0x0000]}) == 65536
 
     def test_u32_assembly_in_sample(self) -> None:
         """[0x0000, 0x2710] -> 10000 W (in range for total_dc_power)."""
@@ -331,6 +339,34 @@ class TestMissingRegister:
         assert result is None
 
 
+class TestShortWordList:
+    """A register with fewer words than its type needs rejects the poll."""
+
+    def test_short_u32_returns_none(self, caplog: pytest.LogCaptureFixture) -> None:
+        raw = _make_raw(total_dc_power=[1000])
+        with caplog.at_level(logging.WARNING):
+            result = normalize(raw, device_id=_DEVICE_ID, ts=_TS)
+        assert result is None
+        assert "Register 'total_dc_power': expected 2 words for U32, got 1" in (
+            caplog.messages
+        )
+
+    def test_empty_u16_returns_none(self) -> None:
+        raw = _make_raw(battery_soc=[])
+        assert normalize(raw, device_id=_DEVICE_ID, ts=_TS) is None
+
+    def test_short_grid_power_blocks_export_fallback(self) -> None:
+        """The -grid_power fallback also requires a well-formed grid_power."""
+        raw = _make_raw(grid_power=[])
+        del raw["export_power"]
+        assert normalize(raw, device_id=_DEVICE_ID, ts=_TS) is None
+
+    def test_short_unused_register_is_ignored(self) -> None:
+        """Registers normalize() does not read are not shape-checked."""
+        raw = _make_raw(grid_power=[])
+        assert normalize(raw, device_id=_DEVICE_ID, ts=_TS) is not None
+
+
 # ===========================================================================
 # AC5: Out-of-range value returns None (with warning logged)
 # ===========================================================================
@@ -356,9 +392,10 @@ class TestOutOfRange:
         raw = _make_raw(battery_soc=[1100])
         with caplog.at_level(logging.WARNING):
             normalize(raw, device_id=_DEVICE_ID, ts=_TS)
-        assert any("battery_soc" in msg for msg in caplog.messages)
+        logged = "\n".join(caplog.messages)
+        assert "battery_soc" in logged
         # Should mention the raw value or scaled value
-        assert any("1100" in msg or "110" in msg for msg in caplog.messages)
+        assert "1100" in logged or "110" in logged
 
     def test_negative_export_power_out_of_range(self) -> None:
         """export_power valid_range is (-20000, 20000). -25000 is out.
@@ -376,6 +413,25 @@ class TestOutOfRange:
 # ===========================================================================
 
 
+_INTEGRATION_FILL: dict[str, list[int]] = {
+    # U32: 3000 W -> [0x0000, 0x0BB8]
+    "total_dc_power": [0x0000, 0x0BB8],
+    # U16: 45 * 0.1 = 4.5 kWh
+    "daily_pv_generation": [45],
+    # S16: 750 W (charging)
+    "battery_power": [750],
+    # U16: 650 * 0.1 = 65.0%
+    "battery_soc": [650],
+    # U16: 230 * 0.1 = 23.0 C
+    "battery_temperature": [230],
+    # S32: 1500 W -> [0, 1500]
+    "load_power": [0, 1500],
+    # S32: 800 W -> [0, 800]
+    "export_power": [0, 800],
+}
+"""Raw words written into the simulated group buffers, by register name."""
+
+
 class TestPollerNormalizerIntegration:
     """Verify that the poller's output format is accepted by the normalizer.
 
@@ -387,42 +443,21 @@ class TestPollerNormalizerIntegration:
     """
 
     def test_simulated_poller_output_normalizes(self) -> None:
-        """Build a dict exactly as _extract_register_values would."""
+        """Build a dict exactly as the poller read plan slices it."""
         from edge.src.registers import ALL_GROUPS
 
         # Simulate raw Modbus words per group, then slice per register
-        # using the same logic as poller._extract_register_values.
+        # using the same offsets as poller._READ_PLAN.
         raw: dict[str, list[int]] = {}
         for group in ALL_GROUPS:
             # Create a zeroed word buffer for the entire group
             words = [0] * group.count
             # Fill in known registers with realistic raw values
             for reg in group.registers:
-                offset = reg.address - group.start_address
-                if reg.name == "total_dc_power":
-                    # U32: 3000 W -> [0x0000, 0x0BB8]
-                    words[offset] = 0x0000
-                    words[offset + 1] = 0x0BB8
-                elif reg.name == "daily_pv_generation":
-                    # U16: 45 * 0.1 = 4.5 kWh
-                    words[offset] = 45
-                elif reg.name == "battery_power":
-                    # S16: 750 W (charging)
-                    words[offset] = 750
-                elif reg.name == "battery_soc":
-                    # U16: 650 * 0.1 = 65.0%
-                    words[offset] = 650
-                elif reg.name == "battery_temperature":
-                    # U16: 230 * 0.1 = 23.0 C
-                    words[offset] = 230
-                elif reg.name == "load_power":
-                    # S32: 1500 W -> [0, 1500]
-                    words[offset] = 0
-                    words[offset + 1] = 1500
-                elif reg.name == "export_power":
-                    # S32: 800 W -> [0, 800]
-                    words[offset] = 0
-                    words[offset + 1] = 800
+                fill = _INTEGRATION_FILL.get(reg.name)
+                if fill is not None:
+                    offset = reg.address - group.start_address
+                    words[offset : offset + len(fill)] = fill
             # Slice per register, exactly as the poller does
             for reg in group.registers:
                 offset = reg.address - group.start_address
@@ -437,3 +472,37 @@ class TestPollerNormalizerIntegration:
         assert result.battery_temp_c == pytest.approx(23.0)
         assert result.load_power_w == 1500.0
         assert result.export_power_w == 800.0
+
+
+# ===========================================================================
+# Import-time normalize plan
+# ===========================================================================
+
+
+class TestNormalizePlan:
+    """_NORMALIZE_PLAN resolves every mapped field once, at import time."""
+
+    def test_plan_resolves_every_field(self) -> None:
+        from edge.src.normalizer import _FIELD_MAP, _NORMALIZE_PLAN
+        from edge.src.registers import ALL_REGISTERS
+
+        assert [entry[0] for entry in _NORMALIZE_PLAN] == list(_FIELD_MAP)
+        for field_name, reg_name, extract, is_export in _NORMALIZE_PLAN:
+            assert reg_name == _FIELD_MAP[field_name]
+            assert reg_name in ALL_REGISTERS
+            assert callable(extract)
+            assert is_export == (field_name == "export_power_w")
+
+    def test_extractor_is_cached_per_register(self) -> None:
+        from edge.src.normalizer import _make_extractor
+        from edge.src.registers import ALL_REGISTERS
+
+        reg_def = ALL_REGISTERS["battery_soc"]
+        assert _make_extractor(reg_def) is _make_extractor(reg_def)
+
+    def test_unknown_register_fails_plan_construction(self) -> None:
+        from edge.src.normalizer import _build_normalize_plan
+        from edge.src.registers import ALL_REGISTERS
+
+        with pytest.raises(KeyError, match="no_such_register"):
+            _build_normalize_plan({"pv_power_w": "no_such_register"}, ALL_REGISTERS)
@@ -6,6 +6,17 @@ reads all register groups with configurable inter-register delays, and returns
 raw register values. Tests use a mocked AsyncModbusTcpClient.
 
 CHANGELOG:
+- 2026-10-16: Mock and assert reads against ALL_GROUPS again
+- 2026-10-16: Test the backoff cap on _compute_backoff() directly
+- 2026-10-16: Share a failing_poller fixture across backoff tests
+- 2026-10-16: Import poller symbols once at module scope
+- 2026-10-16: Match log assertions against the joined messages
+- 2026-10-16: Mock client builds its per-group responses once
+- 2026-10-16: Add backoff jitter and long-outage tests
+- 2026-10-16: Add Poller connection reuse tests
+- 2026-10-16: Check register words are sliced at their address offsets
+- 2026-10-16: Mock and assert reads against the coalesced ALL_GROUPS
+- 2026-10-16: Delay is measured from the previous response
 - 2026-02-14: Initial creation -- TDD tests written first (STORY-003)
 
 TODO:
@@ -18,6 +29,13 @@ import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from edge.src.poller import (
+    BASE_BACKOFF_S,
+    MAX_BACKOFF_S,
+    Poller,
+    _compute_backoff,
+    poll_registers,
+)
 from edge.src.registers import ALL_GROUPS, ALL_REGISTERS
 
 # ---------------------------------------------------------------------------
@@ -75,19 +93,23 @@ def _make_mock_client(
     client.close = MagicMock()
     client.connected = connect_ok
 
-    # Build a side_effect function that matches the address to a group
+    # Responses are built once per client, keyed by (address, count).
+    error_resp = _make_response([], is_error=True)
+    responses: dict[tuple[int, int], MagicMock] = {}
+    for group in ALL_GROUPS:
+        if group.group_name in error_groups:
+            resp = error_resp
+        else:
+            resp = _make_response(group_values[group.group_name])
+        responses[(group.start_address, group.count)] = resp
+
     async def _read_input_registers(
         address: int, *, count: int = 1, device_id: int = 1
     ) -> MagicMock:
         if raise_on_read:
             raise Exception("Simulated Modbus transport error")
-        for group in ALL_GROUPS:
-            if group.start_address == address and group.count == count:
-                if group.group_name in error_groups:
-                    return _make_response([], is_error=True)
-                return _make_response(group_values[group.group_name])
-        # Unexpected call -- return error
-        return _make_response([], is_error=True)
+        # Unexpected address/count -- return error
+        return responses.get((address, count), error_resp)
 
     client.read_input_registers = AsyncMock(side_effect=_read_input_registers)
     return client
@@ -104,8 +126,6 @@ class TestPollerConnect:
     @pytest.mark.asyncio
     async def test_creates_client_with_correct_host_and_port(self) -> None:
         """Poller creates an AsyncModbusTcpClient for the configured host/port."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch(
             "edge.src.poller.AsyncModbusTcpClient", return_value=mock_client
@@ -121,8 +141,6 @@ class TestPollerConnect:
     @pytest.mark.asyncio
     async def test_calls_connect(self) -> None:
         """Poller calls connect() on the client."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             await poll_registers(
@@ -136,8 +154,6 @@ class TestPollerConnect:
     @pytest.mark.asyncio
     async def test_closes_client_after_poll(self) -> None:
         """Poller closes the client connection after a poll cycle."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             await poll_registers(
@@ -162,8 +178,6 @@ class TestPollerReadsAllGroups:
         self,
     ) -> None:
         """Successful poll returns a dict keyed by every register name."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -180,8 +194,6 @@ class TestPollerReadsAllGroups:
     @pytest.mark.asyncio
     async def test_reads_each_group_once(self) -> None:
         """Poller issues exactly one read_input_registers per group."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             await poll_registers(
@@ -196,8 +208,6 @@ class TestPollerReadsAllGroups:
     @pytest.mark.asyncio
     async def test_reads_with_correct_address_count_and_slave_id(self) -> None:
         """Each read uses the group's start_address, count, and configured slave_id."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             await poll_registers(
@@ -224,8 +234,6 @@ class TestPollerReadsAllGroups:
     @pytest.mark.asyncio
     async def test_raw_values_are_lists_of_ints(self) -> None:
         """Each register value in the result dict is a list of raw 16-bit ints."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -248,8 +256,6 @@ class TestPollerReadsAllGroups:
     @pytest.mark.asyncio
     async def test_raw_values_have_correct_word_count(self) -> None:
         """Each register's raw value list has the correct number of words."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -267,6 +273,25 @@ class TestPollerReadsAllGroups:
                 f"got {len(value)}"
             )
 
+    @pytest.mark.asyncio
+    async def test_raw_values_sliced_at_register_offsets(self) -> None:
+        """Each register gets the words at its address offset in its group."""
+        mock_client = _make_mock_client()
+        with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
+            result = await poll_registers(
+                host="192.168.1.100",
+                port=502,
+                slave_id=1,
+                inter_register_delay_ms=0,
+            )
+
+        assert result is not None
+        # Mock groups return 1, 2, 3, ... so word = offset + 1.
+        for group in ALL_GROUPS:
+            for reg in group.registers:
+                first = reg.address - group.start_address + 1
+                assert result[reg.name] == list(range(first, first + reg.word_count))
+
 
 # ===========================================================================
 # AC3: Poller waits INTER_REGISTER_DELAY_MS between group reads
@@ -279,8 +304,6 @@ class TestInterRegisterDelay:
     @pytest.mark.asyncio
     async def test_delay_called_between_group_reads(self) -> None:
         """asyncio.sleep is called between group reads with the correct delay."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         sleep_patch = patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock)
         with (
@@ -300,15 +323,15 @@ class TestInterRegisterDelay:
         # Sleep should be called between groups, i.e., (N-1) times for N groups
         num_groups = len(ALL_GROUPS)
         assert mock_sleep.await_count == num_groups - 1
-        # Each call should use delay_seconds = 50 / 1000 = 0.05
+        # Each call waits out what is left of 50 / 1000 = 0.05 s since the
+        # previous response arrived.
         for call in mock_sleep.call_args_list:
-            assert call.args[0] == pytest.approx(0.05)
+            assert 0 < call.args[0] <= 0.05
+            assert call.args[0] == pytest.approx(0.05, abs=0.01)
 
     @pytest.mark.asyncio
     async def test_no_delay_with_zero_ms(self) -> None:
         """When inter_register_delay_ms is 0, asyncio.sleep is not called."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         sleep_patch = patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock)
         with (
@@ -339,8 +362,6 @@ class TestPollerReturnValues:
     @pytest.mark.asyncio
     async def test_partial_modbus_error_returns_none(self) -> None:
         """If one group read returns an error, the entire poll returns None."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(error_groups={"pv"})
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -355,8 +376,6 @@ class TestPollerReturnValues:
     @pytest.mark.asyncio
     async def test_export_group_error_returns_partial_result(self) -> None:
         """An export-group error is tolerated; other groups are still returned."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(error_groups={"export"})
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -374,8 +393,6 @@ class TestPollerReturnValues:
     @pytest.mark.asyncio
     async def test_connection_failure_returns_none(self) -> None:
         """If connect() returns False, poll returns None."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(connect_ok=False)
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -390,8 +407,6 @@ class TestPollerReturnValues:
     @pytest.mark.asyncio
     async def test_exception_during_read_returns_none(self) -> None:
         """If read_input_registers raises, poll returns None (never propagates)."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(raise_on_read=True)
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             result = await poll_registers(
@@ -406,8 +421,6 @@ class TestPollerReturnValues:
     @pytest.mark.asyncio
     async def test_connect_raises_exception_returns_none(self) -> None:
         """If connect() raises an exception, poll returns None."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client()
         mock_client.connect = AsyncMock(side_effect=OSError("Connection refused"))
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
@@ -434,8 +447,6 @@ class TestPollerLogging:
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
         """A Modbus error response triggers a warning log."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(error_groups={"battery"})
         with (
             patch(
@@ -451,15 +462,13 @@ class TestPollerLogging:
                 inter_register_delay_ms=0,
             )
 
-        assert any("battery" in msg.lower() for msg in caplog.messages)
+        assert "battery" in "\n".join(caplog.messages).lower()
 
     @pytest.mark.asyncio
     async def test_logs_warning_on_connection_failure(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
         """A connection failure triggers a warning log."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(connect_ok=False)
         with (
             patch(
@@ -475,15 +484,13 @@ class TestPollerLogging:
                 inter_register_delay_ms=0,
             )
 
-        assert any("connect" in msg.lower() for msg in caplog.messages)
+        assert "connect" in "\n".join(caplog.messages).lower()
 
     @pytest.mark.asyncio
     async def test_logs_warning_on_exception(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
         """An exception during read triggers a warning log."""
-        from edge.src.poller import poll_registers
-
         mock_client = _make_mock_client(raise_on_read=True)
         with (
             patch(
@@ -504,8 +511,6 @@ class TestPollerLogging:
     @pytest.mark.asyncio
     async def test_never_raises_to_caller(self) -> None:
         """No matter the failure mode, poll_registers never raises."""
-        from edge.src.poller import poll_registers
-
         # Test with various failure modes -- none should raise
         for kwargs in [
             {"connect_ok": False},
@@ -532,36 +537,39 @@ class TestPollerLogging:
 # ===========================================================================
 
 
+@pytest.fixture()
+def failing_poller(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[Poller, AsyncMock]:
+    """Return a Poller whose connects always fail, plus the patched sleep."""
+    mock_client = _make_mock_client(connect_ok=False)
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr(
+        "edge.src.poller.AsyncModbusTcpClient", lambda *a, **k: mock_client
+    )
+    monkeypatch.setattr("edge.src.poller.asyncio.sleep", mock_sleep)
+    poller = Poller(
+        host="192.168.1.100",
+        port=502,
+        slave_id=1,
+        inter_register_delay_ms=0,
+    )
+    return poller, mock_sleep
+
+
 class TestExponentialBackoff:
     """AC6: Poller implements exponential backoff on connection failures."""
 
     @pytest.mark.asyncio
     async def test_backoff_increases_exponentially_on_consecutive_failures(
-        self,
+        self, failing_poller: tuple[Poller, AsyncMock]
     ) -> None:
         """Consecutive connection failures increase backoff exponentially."""
-        from edge.src.poller import Poller
-
-        mock_client = _make_mock_client(connect_ok=False)
-
-        sleep_patch = patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock)
-        with (
-            patch(
-                "edge.src.poller.AsyncModbusTcpClient",
-                return_value=mock_client,
-            ),
-            sleep_patch as mock_sleep,
-        ):
-            poller = Poller(
-                host="192.168.1.100",
-                port=502,
-                slave_id=1,
-                inter_register_delay_ms=0,
-            )
+        poller, mock_sleep = failing_poller
 
-            # Poll multiple times, each should fail and increase backoff
-            for _ in range(4):
-                await poller.poll()
+        # Poll multiple times, each should fail and increase backoff
+        for _ in range(4):
+            await poller.poll()
 
         # Collect the sleep durations used for backoff
         # First poll: no backoff sleep before first attempt
@@ -580,8 +588,6 @@ class TestExponentialBackoff:
     @pytest.mark.asyncio
     async def test_backoff_resets_after_successful_read(self) -> None:
         """After a successful poll, backoff delay resets to zero."""
-        from edge.src.poller import Poller
-
         call_count = 0
 
         def _make_client_factory(*args, **kwargs):
@@ -619,60 +625,55 @@ class TestExponentialBackoff:
             # Verify by checking the _consecutive_failures attribute.
             assert poller._consecutive_failures == 0
 
-    @pytest.mark.asyncio
-    async def test_backoff_has_maximum_cap(self) -> None:
+    def test_backoff_has_maximum_cap(self) -> None:
         """Backoff delay is capped at a maximum value."""
-        from edge.src.poller import MAX_BACKOFF_S, Poller
-
-        mock_client = _make_mock_client(connect_ok=False)
+        with patch("edge.src.poller.random.random", return_value=1.0):
+            for n in (1, 2, 5, 10, 20, 50):
+                assert _compute_backoff(n) <= MAX_BACKOFF_S
+            assert _compute_backoff(50) == MAX_BACKOFF_S
 
-        sleep_patch = patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock)
-        with (
-            patch(
-                "edge.src.poller.AsyncModbusTcpClient",
-                return_value=mock_client,
-            ),
-            sleep_patch as mock_sleep,
-        ):
-            poller = Poller(
-                host="192.168.1.100",
-                port=502,
-                slave_id=1,
-                inter_register_delay_ms=0,
-            )
+    @pytest.mark.asyncio
+    async def test_backoff_jitter_is_half_to_full_step(
+        self,
+        failing_poller: tuple[Poller, AsyncMock],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Jitter scales each step into [0.5, 1.0] of its nominal delay."""
+        poller, mock_sleep = failing_poller
+        monkeypatch.setattr(
+            "edge.src.poller.random.random", MagicMock(side_effect=[0.0, 1.0])
+        )
 
-            # Poll many times to exceed the cap
-            for _ in range(20):
-                await poller.poll()
+        for _ in range(3):
+            await poller.poll()
 
-        backoff_delays = [c.args[0] for c in mock_sleep.call_args_list]
-        for delay in backoff_delays:
-            assert delay <= MAX_BACKOFF_S
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [
+            pytest.approx(0.5 * BASE_BACKOFF_S),
+            pytest.approx(2 * BASE_BACKOFF_S),
+        ]
 
     @pytest.mark.asyncio
-    async def test_first_poll_has_no_backoff_delay(self) -> None:
-        """The very first poll attempt does not sleep for backoff."""
-        from edge.src.poller import Poller
+    async def test_backoff_after_long_outage_stays_capped(
+        self, failing_poller: tuple[Poller, AsyncMock]
+    ) -> None:
+        """A very large failure count still yields a capped delay."""
+        poller, mock_sleep = failing_poller
+        poller._consecutive_failures = 100_000
 
-        mock_client = _make_mock_client(connect_ok=False)
+        await poller.poll()
 
-        sleep_patch = patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock)
-        with (
-            patch(
-                "edge.src.poller.AsyncModbusTcpClient",
-                return_value=mock_client,
-            ),
-            sleep_patch as mock_sleep,
-        ):
-            poller = Poller(
-                host="192.168.1.100",
-                port=502,
-                slave_id=1,
-                inter_register_delay_ms=0,
-            )
+        assert 0.5 * MAX_BACKOFF_S <= mock_sleep.call_args.args[0] <= MAX_BACKOFF_S
 
-            # First poll -- should not have a backoff sleep
-            await poller.poll()
+    @pytest.mark.asyncio
+    async def test_first_poll_has_no_backoff_delay(
+        self, failing_poller: tuple[Poller, AsyncMock]
+    ) -> None:
+        """The very first poll attempt does not sleep for backoff."""
+        poller, mock_sleep = failing_poller
+
+        # First poll -- should not have a backoff sleep
+        await poller.poll()
 
         # No sleep calls for the first poll (no backoff yet)
         mock_sleep.assert_not_awaited()
@@ -689,8 +690,6 @@ class TestPollerClass:
     @pytest.mark.asyncio
     async def test_poller_poll_returns_dict_on_success(self) -> None:
         """Poller.poll() returns a complete register dict on success."""
-        from edge.src.poller import Poller
-
         mock_client = _make_mock_client()
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             poller = Poller(
@@ -707,8 +706,6 @@ class TestPollerClass:
     @pytest.mark.asyncio
     async def test_poller_poll_returns_none_on_failure(self) -> None:
         """Poller.poll() returns None when connection fails."""
-        from edge.src.poller import Poller
-
         mock_client = _make_mock_client(connect_ok=False)
         with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
             poller = Poller(
@@ -724,8 +721,6 @@ class TestPollerClass:
     @pytest.mark.asyncio
     async def test_poller_uses_configured_slave_id(self) -> None:
         """Poller passes the configured slave_id as device_id to reads."""
-        from edge.src.poller import Poller
-
         group_values = _build_successful_responses()
 
         # Custom mock that accepts any device_id
@@ -754,3 +749,73 @@ class TestPollerClass:
         # Verify all reads used device_id=7
         for call in client.read_input_registers.call_args_list:
             assert call.kwargs.get("device_id") == 7
+
+
+# ===========================================================================
+# Poller keeps its Modbus connection open across polls
+# ===========================================================================
+
+
+class TestPollerConnectionReuse:
+    """Poller reuses one connection until an error or max_reuse polls."""
+
+    @pytest.mark.asyncio
+    async def test_successful_polls_reuse_connection(self) -> None:
+        """Consecutive successful polls share one client and one connect."""
+        mock_client = _make_mock_client()
+        with patch(
+            "edge.src.poller.AsyncModbusTcpClient", return_value=mock_client
+        ) as mock_cls:
+            poller = Poller(host="192.168.1.100", inter_register_delay_ms=0)
+            await poller.poll()
+            await poller.poll()
+            await poller.poll()
+
+        assert mock_cls.call_count == 1
+        mock_client.connect.assert_awaited_once()
+        mock_client.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_drops_connection(self) -> None:
+        """A failed poll closes the client; the next poll reconnects."""
+        failing = _make_mock_client(error_groups={"pv"})
+        healthy = _make_mock_client()
+        with (
+            patch(
+                "edge.src.poller.AsyncModbusTcpClient",
+                side_effect=[failing, healthy],
+            ),
+            patch("edge.src.poller.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            poller = Poller(host="192.168.1.100", inter_register_delay_ms=0)
+            assert await poller.poll() is None
+            assert await poller.poll() is not None
+
+        failing.close.assert_called_once()
+        healthy.connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_max_reuse(self) -> None:
+        """After max_reuse polls the connection is replaced."""
+        clients = [_make_mock_client(), _make_mock_client()]
+        with patch("edge.src.poller.AsyncModbusTcpClient", side_effect=clients):
+            poller = Poller(
+                host="192.168.1.100", inter_register_delay_ms=0, max_reuse=2
+            )
+            for _ in range(3):
+                assert await poller.poll() is not None
+
+        clients[0].close.assert_called_once()
+        clients[1].connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_cached_client(self) -> None:
+        """close() closes the open connection and is safe to repeat."""
+        mock_client = _make_mock_client()
+        with patch("edge.src.poller.AsyncModbusTcpClient", return_value=mock_client):
+            poller = Poller(host="192.168.1.100", inter_register_delay_ms=0)
+            await poller.poll()
+
+        poller.close()
+        poller.close()
+        mock_client.close.assert_called_once()
@@ -4,6 +4,11 @@ Tests for Sungrow Modbus register map.
 Verifies register map integrity, consistency, and grouping for batched reads.
 
 CHANGELOG:
+- 2026-10-16: Replace POLL_GROUPS coalescing tests with an optional-group test
+- 2026-10-16: Use _ALL_NAMES directly instead of local aliases
+- 2026-10-16: Assert POLL_GROUPS reads no addresses outside ALL_GROUPS
+- 2026-10-16: Flatten group/register pairs and names once at module scope
+- 2026-10-16: Add coalesced POLL_GROUPS tests
 - 2026-02-14: Initial creation — TDD tests written first (STORY-002)
 
 TODO:
@@ -60,13 +65,14 @@ VALID_TYPES = {"U16", "U32", "S16", "S32", "UTF8"}
 
 
 # ---------------------------------------------------------------------------
-# Helper: collect all register names from ALL_GROUPS
+# Flattened register map: every (group, register) pair and all names
 # ---------------------------------------------------------------------------
 
+_FLAT_REGS: list[tuple[RegisterGroup, RegisterDef]] = [
+    (group, reg) for group in ALL_GROUPS for reg in group.registers
+]
 
-def _all_register_names() -> set[str]:
-    """Return the set of all register names across all groups."""
-    return {reg.name for group in ALL_GROUPS for reg in group.registers}
+_ALL_NAMES: frozenset[str] = frozenset(reg.name for _, reg in _FLAT_REGS)
 
 
 # ===========================================================================
@@ -78,9 +84,8 @@ class TestPVRegisters:
     """AC1: registers.py defines all PV registers."""
 
     def test_pv_registers_present(self) -> None:
-        names = _all_register_names()
         for reg_name in PV_REGISTER_NAMES:
-            assert reg_name in names, f"PV register '{reg_name}' missing"
+            assert reg_name in _ALL_NAMES, f"PV register '{reg_name}' missing"
 
     def test_total_dc_power_is_u32(self) -> None:
         reg = ALL_REGISTERS["total_dc_power"]
@@ -119,9 +124,8 @@ class TestBatteryRegisters:
     """AC2: registers.py defines all battery registers."""
 
     def test_battery_registers_present(self) -> None:
-        names = _all_register_names()
         for reg_name in BATTERY_REGISTER_NAMES:
-            assert reg_name in names, f"Battery register '{reg_name}' missing"
+            assert reg_name in _ALL_NAMES, f"Battery register '{reg_name}' missing"
 
     def test_battery_power_is_signed(self) -> None:
         reg = ALL_REGISTERS["battery_power"]
@@ -153,9 +157,8 @@ class TestLoadRegisters:
     """AC3: registers.py defines load registers."""
 
     def test_load_registers_present(self) -> None:
-        names = _all_register_names()
         for reg_name in LOAD_REGISTER_NAMES:
-            assert reg_name in names, f"Load register '{reg_name}' missing"
+            assert reg_name in _ALL_NAMES, f"Load register '{reg_name}' missing"
 
     def test_load_power_is_signed_32(self) -> None:
         reg = ALL_REGISTERS["load_power"]
@@ -177,9 +180,8 @@ class TestGridRegisters:
     """AC4: registers.py defines grid estimate registers."""
 
     def test_grid_registers_present(self) -> None:
-        names = _all_register_names()
         for reg_name in GRID_REGISTER_NAMES:
-            assert reg_name in names, f"Grid register '{reg_name}' missing"
+            assert reg_name in _ALL_NAMES, f"Grid register '{reg_name}' missing"
 
     def test_export_power_is_s32(self) -> None:
         reg = ALL_REGISTERS["export_power"]
@@ -200,9 +202,8 @@ class TestDeviceRegisters:
     """AC5: registers.py defines device info registers."""
 
     def test_device_registers_present(self) -> None:
-        names = _all_register_names()
         for reg_name in DEVICE_REGISTER_NAMES:
-            assert reg_name in names, f"Device register '{reg_name}' missing"
+            assert reg_name in _ALL_NAMES, f"Device register '{reg_name}' missing"
 
     def test_device_type_code_is_u16(self) -> None:
         reg = ALL_REGISTERS["device_type_code"]
@@ -222,60 +223,55 @@ class TestRegisterFields:
     """AC6: Each register has address, name, type, unit, scaling factor, valid range."""
 
     def test_all_registers_have_required_fields(self) -> None:
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                assert isinstance(reg.address, int), f"{reg.name}: address must be int"
-                assert isinstance(reg.name, str) and len(reg.name) > 0, (
-                    f"register at {reg.address}: name must be non-empty str"
-                )
-                assert reg.reg_type in VALID_TYPES, (
-                    f"{reg.name}: invalid type '{reg.reg_type}'"
-                )
-                assert isinstance(reg.unit, str), f"{reg.name}: unit must be str"
-                assert isinstance(reg.scale, (int, float)), (
-                    f"{reg.name}: scale must be numeric"
+        for _, reg in _FLAT_REGS:
+            assert isinstance(reg.address, int), f"{reg.name}: address must be int"
+            assert isinstance(reg.name, str) and len(reg.name) > 0, (
+                f"register at {reg.address}: name must be non-empty str"
+            )
+            assert reg.reg_type in VALID_TYPES, (
+                f"{reg.name}: invalid type '{reg.reg_type}'"
+            )
+            assert isinstance(reg.unit, str), f"{reg.name}: unit must be str"
+            assert isinstance(reg.scale, (int, float)), (
+                f"{reg.name}: scale must be numeric"
+            )
+            # valid_range is optional but if present must be a 2-tuple
+            if reg.valid_range is not None:
+                assert len(reg.valid_range) == 2, (
+                    f"{reg.name}: valid_range must be (min, max)"
                 )
-                # valid_range is optional but if present must be a 2-tuple
-                if reg.valid_range is not None:
-                    assert len(reg.valid_range) == 2, (
-                        f"{reg.name}: valid_range must be (min, max)"
-                    )
 
     def test_scaling_factors_are_positive_numbers(self) -> None:
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                assert reg.scale > 0, f"{reg.name}: scale must be > 0, got {reg.scale}"
+        for _, reg in _FLAT_REGS:
+            assert reg.scale > 0, f"{reg.name}: scale must be > 0, got {reg.scale}"
 
     def test_valid_range_min_less_than_max(self) -> None:
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                if reg.valid_range is not None:
-                    lo, hi = reg.valid_range
-                    assert lo < hi, (
-                        f"{reg.name}: valid_range min ({lo}) must be < max ({hi})"
-                    )
+        for _, reg in _FLAT_REGS:
+            if reg.valid_range is not None:
+                lo, hi = reg.valid_range
+                assert lo < hi, (
+                    f"{reg.name}: valid_range min ({lo}) must be < max ({hi})"
+                )
 
     def test_no_duplicate_register_addresses(self) -> None:
         seen: dict[int, str] = {}
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                # For multi-register types (U32, S32, UTF8), only the
-                # start address is stored; that is the canonical address.
-                assert reg.address not in seen, (
-                    f"Duplicate address {reg.address}: "
-                    f"'{seen[reg.address]}' and '{reg.name}'"
-                )
-                seen[reg.address] = reg.name
+        for _, reg in _FLAT_REGS:
+            # For multi-register types (U32, S32, UTF8), only the
+            # start address is stored; that is the canonical address.
+            assert reg.address not in seen, (
+                f"Duplicate address {reg.address}: "
+                f"'{seen[reg.address]}' and '{reg.name}'"
+            )
+            seen[reg.address] = reg.name
 
     def test_no_duplicate_register_names(self) -> None:
         seen: dict[str, int] = {}
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                assert reg.name not in seen, (
-                    f"Duplicate name '{reg.name}': "
-                    f"address {seen[reg.name]} and {reg.address}"
-                )
-                seen[reg.name] = reg.address
+        for _, reg in _FLAT_REGS:
+            assert reg.name not in seen, (
+                f"Duplicate name '{reg.name}': "
+                f"address {seen[reg.name]} and {reg.address}"
+            )
+            seen[reg.name] = reg.address
 
 
 # ===========================================================================
@@ -344,10 +340,9 @@ class TestRegisterGroups:
 
     def test_all_registers_dict_contains_all_registers(self) -> None:
         """ALL_REGISTERS dict is a flat lookup of all registers by name."""
-        for group in ALL_GROUPS:
-            for reg in group.registers:
-                assert reg.name in ALL_REGISTERS
-                assert ALL_REGISTERS[reg.name] is reg
+        for _, reg in _FLAT_REGS:
+            assert reg.name in ALL_REGISTERS
+            assert ALL_REGISTERS[reg.name] is reg
 
 
 # ===========================================================================
@@ -387,6 +382,19 @@ class TestDataclasses:
         )
 
 
+# ===========================================================================
+# Optional groups
+# ===========================================================================
+
+
+class TestOptionalGroups:
+    """Only groups some firmwares omit are flagged optional."""
+
+    def test_only_export_group_is_optional(self) -> None:
+        optional = [g for g in ALL_GROUPS if g.optional]
+        assert [g.group_name for g in optional] == ["export"]
+
+
 # ===========================================================================
 # Helper
 # ===========================================================================
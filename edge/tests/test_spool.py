@@ -9,12 +9,29 @@ Tests verify:
 - count() returns number of pending samples.
 - FIFO ordering (oldest first in peek).
 - WAL mode is enabled (pragma journal_mode).
+- Connection PRAGMAs (synchronous, temp_store, cache, busy_timeout) applied.
 - Empty spool peek returns empty list.
 - peek(n) respects limit.
 - Concurrent read/write without corruption.
 - Persistence across close/reopen.
+- enqueue_many(payloads) inserts a batch in order in one transaction,
+  and rolls back entirely on failure.
+- ack() deletes non-contiguous id lists with an IN cached per length.
+- ack() range-deletes contiguous rowids without touching neighbours.
 
 CHANGELOG:
+- 2026-10-16: Add enqueue_many rollback test
+- 2026-10-16: Add cached ack IN statement test
+- 2026-10-16: Replace bucketed ack statement tests with a sparse IN ack test
+- 2026-10-16: Expect 8 MiB cache_size and mmap_size PRAGMAs
+- 2026-10-16: Check journal_size_limit PRAGMA
+- 2026-10-16: Add contiguous-range ack tests
+- 2026-10-16: Assert peek() returns a list of plain tuples
+- 2026-10-16: Add in-memory count tests (reopen, batch, unknown rowids)
+- 2026-10-16: Add bucketed ack statement tests
+- 2026-10-16: rowid test asserts monotonicity while rows are pending
+- 2026-10-16: Add connection PRAGMA tests
+- 2026-10-16: Add enqueue_many batch insert tests
 - 2026-02-14: Initial creation (STORY-005)
 
 TODO:
@@ -28,7 +45,7 @@ import json
 from pathlib import Path
 
 import pytest
-from edge.src.spool import Spool
+from edge.src.spool import Spool, _ack_in_sql
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -88,6 +105,25 @@ class TestSpoolCreation:
         assert journal_mode == "wal"
         await spool.close()
 
+    @pytest.mark.asyncio
+    async def test_connection_pragmas_applied(self, tmp_path: Path) -> None:
+        """The spool connection uses the write-throughput PRAGMA set."""
+        expected = {
+            "synchronous": 1,  # NORMAL
+            "temp_store": 2,  # MEMORY
+            "cache_size": -8192,
+            "mmap_size": 8388608,
+            "busy_timeout": 3000,
+            "journal_size_limit": 8388608,
+        }
+        async with Spool(path=tmp_path / "pragma.db") as spool:
+            actual = {}
+            for name in expected:
+                cursor = await spool._db.execute(f"PRAGMA {name};")
+                actual[name] = (await cursor.fetchone())[0]
+
+        assert actual == expected
+
     @pytest.mark.asyncio
     async def test_accepts_string_path(self, tmp_path: Path) -> None:
         """Constructor accepts both str and Path objects."""
@@ -138,6 +174,8 @@ class TestEnqueueAndPeek:
             rows = await spool.peek(10)
 
             assert len(rows) == 1
+            assert type(rows) is list
+            assert type(rows[0]) is tuple
             rowid, returned_payload = rows[0]
             assert isinstance(rowid, int)
             assert returned_payload == payload
@@ -369,6 +407,86 @@ class TestCount:
             await spool.enqueue(_make_payload(ts="2026-02-14T10:00:05Z"))
             assert await spool.count() == 4
 
+    @pytest.mark.asyncio
+    async def test_count_after_enqueue_many(self, tmp_path: Path) -> None:
+        """enqueue_many() adds the whole batch to count()."""
+        async with Spool(path=tmp_path / "count_many.db") as spool:
+            await spool.enqueue_many([_make_payload(), _make_payload()])
+            assert await spool.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_unknown_rowids(self, tmp_path: Path) -> None:
+        """Acking rowids that do not exist leaves count() unchanged."""
+        async with Spool(path=tmp_path / "count_unknown.db") as spool:
+            await spool.enqueue(_make_payload())
+            await spool.ack([9999, 10000])
+            assert await spool.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_count_seeded_on_reopen(self, tmp_path: Path) -> None:
+        """Rows left from a previous run are counted after open()."""
+        db_path = tmp_path / "count_reopen.db"
+        async with Spool(path=db_path) as spool:
+            await spool.enqueue_many([_make_payload() for _ in range(3)])
+
+        async with Spool(path=db_path) as spool:
+            assert await spool.count() == 3
+
+
+# ---------------------------------------------------------------------------
+# Batch enqueue
+# ---------------------------------------------------------------------------
+
+
+class TestEnqueueMany:
+    """enqueue_many() inserts several payloads in one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_preserves_order(self, tmp_path: Path) -> None:
+        """Batched payloads are peeked back in insertion order."""
+        payloads = [_make_payload(ts=f"2026-02-14T10:00:0{i}Z") for i in range(3)]
+        async with Spool(path=tmp_path / "spool.db") as spool:
+            await spool.enqueue_many(payloads)
+
+            rows = await spool.peek(10)
+            assert [payload for _, payload in rows] == payloads
+            assert await spool.count() == 3
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_empty_is_noop(self, tmp_path: Path) -> None:
+        """An empty batch inserts nothing."""
+        async with Spool(path=tmp_path / "spool.db") as spool:
+            await spool.enqueue_many([])
+
+            assert await spool.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_failure_rolls_back(self, tmp_path: Path) -> None:
+        """A failed batch leaves no partial rows for a later commit."""
+        import sqlite3
+
+        first = _make_payload(ts="2026-02-14T10:00:00Z")
+        later = _make_payload(ts="2026-02-14T10:00:01Z")
+        async with Spool(path=tmp_path / "spool.db") as spool:
+            # NULL violates payload NOT NULL after the first row is inserted.
+            with pytest.raises(sqlite3.IntegrityError):
+                await spool.enqueue_many([first, None])  # type: ignore[list-item]
+
+            await spool.enqueue(later)
+
+            assert await spool.count() == 1
+            assert [payload for _, payload in await spool.peek(10)] == [later]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_persists(self, tmp_path: Path) -> None:
+        """Batched payloads are committed and survive close/reopen."""
+        db_path = tmp_path / "spool.db"
+        async with Spool(path=db_path) as spool:
+            await spool.enqueue_many([_make_payload(), _make_payload()])
+
+        async with Spool(path=db_path) as spool:
+            assert await spool.count() == 2
+
 
 # ---------------------------------------------------------------------------
 # Parameterized SQL (AC6)
@@ -489,6 +607,56 @@ class TestPersistence:
             assert first["ts"] == "2026-02-14T10:00:01Z"
 
 
+# ---------------------------------------------------------------------------
+# ack statement selection
+# ---------------------------------------------------------------------------
+
+
+class TestAckStatements:
+    """ack() range-deletes contiguous ids and uses IN for other lists."""
+
+    def test_in_sql_is_cached_per_length(self) -> None:
+        """The same rowid count returns the same SQL object."""
+        assert _ack_in_sql(3) is _ack_in_sql(3)
+        assert _ack_in_sql(3).count("?") == 3
+
+    @pytest.mark.asyncio
+    async def test_sparse_ack_deletes_only_given_rows(self, tmp_path: Path) -> None:
+        """Non-contiguous ids fall back to IN and leave the gap rows."""
+        async with Spool(path=tmp_path / "sparse.db") as spool:
+            await spool.enqueue_many([_make_payload(pv_power_w=i) for i in range(5)])
+            rows = await spool.peek(5)
+
+            await spool.ack([rows[0][0], rows[2][0], rows[4][0]])
+
+            remaining = await spool.peek(10)
+            assert [r[0] for r in remaining] == [rows[1][0], rows[3][0]]
+
+    @pytest.mark.asyncio
+    async def test_contiguous_unsorted_ack_deletes_range(self, tmp_path: Path) -> None:
+        """A contiguous run in any order is fully deleted."""
+        async with Spool(path=tmp_path / "range.db") as spool:
+            await spool.enqueue_many([_make_payload(pv_power_w=i) for i in range(5)])
+            ids = [r[0] for r in await spool.peek(5)]
+
+            await spool.ack([ids[3], ids[1], ids[2]])
+
+            assert [r[0] for r in await spool.peek(10)] == [ids[0], ids[4]]
+            assert await spool.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_do_not_widen_range(self, tmp_path: Path) -> None:
+        """Duplicates that span a gap do not delete the gap row."""
+        async with Spool(path=tmp_path / "dupes.db") as spool:
+            await spool.enqueue_many([_make_payload(pv_power_w=i) for i in range(3)])
+            ids = [r[0] for r in await spool.peek(3)]
+
+            await spool.ack([ids[0], ids[0], ids[2]])
+
+            assert [r[0] for r in await spool.peek(10)] == [ids[1]]
+            assert await spool.count() == 1
+
+
 # ---------------------------------------------------------------------------
 # Schema validation
 # ---------------------------------------------------------------------------
@@ -516,9 +684,9 @@ class TestSchema:
         assert columns["created_at"] == "TEXT"
 
     @pytest.mark.asyncio
-    async def test_rowid_is_autoincrement(self, tmp_path: Path) -> None:
-        """rowid uses AUTOINCREMENT (never reused after deletion)."""
-        async with Spool(path=tmp_path / "autoincrement.db") as spool:
+    async def test_rowid_is_monotonic_while_pending(self, tmp_path: Path) -> None:
+        """New rowids exceed every pending rowid after a partial ack."""
+        async with Spool(path=tmp_path / "rowid.db") as spool:
             await spool.enqueue(_make_payload(ts="2026-02-14T10:00:00Z"))
             await spool.enqueue(_make_payload(ts="2026-02-14T10:00:01Z"))
             rows = await spool.peek(2)
@@ -535,6 +703,21 @@ class TestSchema:
 
             assert new_rowid > second_rowid
 
+    @pytest.mark.asyncio
+    async def test_no_sqlite_sequence_table(self, tmp_path: Path) -> None:
+        """The spool table does not use AUTOINCREMENT bookkeeping."""
+        import aiosqlite
+
+        db_path = tmp_path / "no_sequence.db"
+        async with Spool(path=db_path) as spool:
+            await spool.enqueue(_make_payload())
+
+        async with aiosqlite.connect(str(db_path)) as conn:
+            cursor = await conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'sqlite_sequence';"
+            )
+            assert await cursor.fetchone() is None
+
     @pytest.mark.asyncio
     async def test_created_at_is_auto_populated(self, tmp_path: Path) -> None:
         """created_at column is automatically populated."""
@@ -12,6 +12,7 @@ Tests verify:
 - TLS certificate verification always enabled (AC8).
 
 CHANGELOG:
+- 2026-10-16: POST body is raw JSON content; assert Content-Type
 - 2026-02-14: Initial creation (STORY-006)
 
 TODO:
@@ -190,15 +191,17 @@ class TestPostPayload:
         assert call_args[0][0] == "https://solar.example.com/v1/ingest"
 
         # Check payload structure.
-        posted_json = call_args[1]["json"]
+        posted_json = json.loads(call_args[1]["content"])
         assert "samples" in posted_json
         assert len(posted_json["samples"]) == 2
-        # Each sample should be a parsed dict.
+        # Each sample should be a JSON object, not a quoted string.
         assert posted_json["samples"][0]["device_id"] == "sungrow-test"
+        assert posted_json["samples"] == [json.loads(p) for _, p in rows]
 
-        # Check Authorization header.
+        # Check Authorization and Content-Type headers.
         headers = call_args[1]["headers"]
         assert headers["Authorization"] == "Bearer my-secret-token"
+        assert headers["Content-Type"] == "application/json"
 
 
 # ---------------------------------------------------------------------------